@@ -8,7 +8,6 @@ from alembic import context
 import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from core.config import settings
 from models.base import Base
 import models.meeting
 import models.user
@@ -0,0 +1,67 @@
+"""initial schema
+
+Databases created earlier by core.database.create_tables already match this
+revision; mark them with ``alembic stamp 0001`` before upgrading.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+        sa.Column('email', sa.String(255), nullable=False),
+        sa.Column('full_name', sa.String(100), nullable=False),
+        sa.Column('hashed_password', sa.String(255), nullable=True),
+        sa.Column('is_active', sa.Boolean()),
+        sa.Column('google_id', sa.String(255), nullable=True),
+        sa.Column('timezone', sa.String(50)),
+    )
+    op.create_index('ix_users_id', 'users', ['id'])
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    op.create_table(
+        'meetings',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+        sa.Column('title', sa.String(100), nullable=False),
+        sa.Column('description', sa.String(500), nullable=True),
+        sa.Column('start_time', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('end_time', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('location', sa.String(100), nullable=True),
+        sa.Column('organizer_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('google_event_id', sa.String(255), nullable=True),
+    )
+    op.create_index('ix_meetings_id', 'meetings', ['id'])
+    op.create_index('ix_meetings_start_time', 'meetings', ['start_time'])
+    op.create_index('ix_meetings_end_time', 'meetings', ['end_time'])
+
+    op.create_table(
+        'meeting_attendees',
+        sa.Column('meeting_id', sa.Integer(), sa.ForeignKey('meetings.id'), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('meeting_attendees')
+    op.drop_table('meetings')
+    op.drop_table('users')
@@ -0,0 +1,233 @@
+"""partition meetings and meeting_attendees by month
+
+meetings is range-partitioned on start_time and meeting_attendees on a copy
+of it (meeting_start_time), so both tables share monthly boundaries. The
+composite foreign key cascades start_time changes to the attendee rows.
+
+Two functions maintain the partitions:
+
+* create_meeting_partitions(from_month, to_month) creates missing monthly
+  partitions, moving any rows that fell into the default partitions.
+* drop_meeting_partitions_before(cutoff) detaches and drops whole months
+  whose meetings all ended before the cutoff.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CREATE_PARTITIONS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION create_meeting_partitions(from_month date, to_month date)
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start date := date_trunc('month', from_month)::date;
+    lower_bound timestamptz;
+    upper_bound timestamptz;
+    suffix text;
+    created integer := 0;
+BEGIN
+    WHILE month_start < to_month LOOP
+        suffix := to_char(month_start, '"y"YYYY"m"MM');
+        lower_bound := month_start::timestamp AT TIME ZONE 'UTC';
+        upper_bound := (month_start + interval '1 month')::timestamp AT TIME ZONE 'UTC';
+        IF to_regclass('meetings_' || suffix) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I (LIKE meetings INCLUDING DEFAULTS)', 'meetings_' || suffix);
+            EXECUTE format('CREATE TABLE %I (LIKE meeting_attendees INCLUDING DEFAULTS)', 'meeting_attendees_' || suffix);
+            -- Rows stored in the default partitions before this month existed move over
+            EXECUTE format(
+                'INSERT INTO %I SELECT * FROM meetings_default WHERE start_time >= $1 AND start_time < $2',
+                'meetings_' || suffix
+            ) USING lower_bound, upper_bound;
+            EXECUTE format(
+                'INSERT INTO %I SELECT * FROM meeting_attendees_default '
+                'WHERE meeting_start_time >= $1 AND meeting_start_time < $2',
+                'meeting_attendees_' || suffix
+            ) USING lower_bound, upper_bound;
+            DELETE FROM meeting_attendees_default
+                WHERE meeting_start_time >= lower_bound AND meeting_start_time < upper_bound;
+            DELETE FROM meetings_default
+                WHERE start_time >= lower_bound AND start_time < upper_bound;
+            EXECUTE format(
+                'ALTER TABLE meetings ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                'meetings_' || suffix, lower_bound, upper_bound
+            );
+            EXECUTE format(
+                'ALTER TABLE meeting_attendees ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                'meeting_attendees_' || suffix, lower_bound, upper_bound
+            );
+            created := created + 1;
+        END IF;
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END
+$$;
+"""
+
+DROP_PARTITIONS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION drop_meeting_partitions_before(cutoff timestamptz)
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    part record;
+    still_running boolean;
+    dropped integer := 0;
+BEGIN
+    FOR part IN
+        SELECT substring(c.relname FROM '^meetings_(y\d{4}m\d{2})$') AS suffix
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'meetings'::regclass
+          AND c.relname ~ '^meetings_y\d{4}m\d{2}$'
+        ORDER BY 1
+    LOOP
+        EXIT WHEN (to_date(part.suffix, '"y"YYYY"m"MM') + interval '1 month')::timestamp AT TIME ZONE 'UTC' > cutoff;
+        -- A meeting that started in this month may still end after the cutoff
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I WHERE end_time >= $1)', 'meetings_' || part.suffix)
+            INTO still_running USING cutoff;
+        EXIT WHEN still_running;
+        EXECUTE format('ALTER TABLE meeting_attendees DETACH PARTITION %I', 'meeting_attendees_' || part.suffix);
+        EXECUTE format('DROP TABLE %I', 'meeting_attendees_' || part.suffix);
+        EXECUTE format('ALTER TABLE meetings DETACH PARTITION %I', 'meetings_' || part.suffix);
+        EXECUTE format('DROP TABLE %I', 'meetings_' || part.suffix);
+        dropped := dropped + 1;
+    END LOOP;
+    RETURN dropped;
+END
+$$;
+"""
+
+
+def upgrade() -> None:
+    # Move the plain tables aside; index and constraint names are schema-wide
+    op.execute("ALTER TABLE meeting_attendees RENAME TO meeting_attendees_unpartitioned")
+    op.execute("ALTER TABLE meeting_attendees_unpartitioned RENAME CONSTRAINT meeting_attendees_pkey TO meeting_attendees_unpartitioned_pkey")
+    op.execute("ALTER TABLE meetings RENAME TO meetings_unpartitioned")
+    op.execute("ALTER TABLE meetings_unpartitioned RENAME CONSTRAINT meetings_pkey TO meetings_unpartitioned_pkey")
+    op.drop_index('ix_meetings_id', table_name='meetings_unpartitioned')
+    op.drop_index('ix_meetings_start_time', table_name='meetings_unpartitioned')
+    op.drop_index('ix_meetings_end_time', table_name='meetings_unpartitioned')
+
+    op.execute("""
+        CREATE TABLE meetings (
+            id integer NOT NULL DEFAULT nextval('meetings_id_seq'),
+            created_at timestamptz DEFAULT now(),
+            updated_at timestamptz,
+            title varchar(100) NOT NULL,
+            description varchar(500),
+            start_time timestamptz NOT NULL,
+            end_time timestamptz NOT NULL,
+            location varchar(100),
+            organizer_id integer NOT NULL REFERENCES users (id),
+            google_event_id varchar(255),
+            CONSTRAINT meetings_pkey PRIMARY KEY (id, start_time)
+        ) PARTITION BY RANGE (start_time)
+    """)
+    op.execute("ALTER SEQUENCE meetings_id_seq OWNED BY meetings.id")
+    op.create_index('ix_meetings_id', 'meetings', ['id'])
+    op.create_index('ix_meetings_start_time', 'meetings', ['start_time'])
+    op.create_index('ix_meetings_end_time', 'meetings', ['end_time'])
+
+    op.execute("""
+        CREATE TABLE meeting_attendees (
+            meeting_id integer NOT NULL,
+            user_id integer NOT NULL REFERENCES users (id),
+            meeting_start_time timestamptz NOT NULL,
+            CONSTRAINT meeting_attendees_pkey PRIMARY KEY (meeting_id, user_id, meeting_start_time),
+            CONSTRAINT meeting_attendees_meeting_fkey FOREIGN KEY (meeting_id, meeting_start_time)
+                REFERENCES meetings (id, start_time) ON UPDATE CASCADE ON DELETE CASCADE
+        ) PARTITION BY RANGE (meeting_start_time)
+    """)
+    op.create_index('ix_meeting_attendees_user_start', 'meeting_attendees', ['user_id', 'meeting_start_time'])
+
+    op.execute("CREATE TABLE meetings_default PARTITION OF meetings DEFAULT")
+    op.execute("CREATE TABLE meeting_attendees_default PARTITION OF meeting_attendees DEFAULT")
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute(DROP_PARTITIONS_FUNCTION)
+    # Cover existing data and the next year
+    op.execute("""
+        SELECT create_meeting_partitions(
+            (COALESCE((SELECT min(start_time) FROM meetings_unpartitioned), now()) AT TIME ZONE 'UTC')::date,
+            ((now() + interval '12 months') AT TIME ZONE 'UTC')::date
+        )
+    """)
+
+    op.execute("""
+        INSERT INTO meetings (id, created_at, updated_at, title, description, start_time, end_time,
+                              location, organizer_id, google_event_id)
+        SELECT id, created_at, updated_at, title, description, start_time, end_time,
+               location, organizer_id, google_event_id
+        FROM meetings_unpartitioned
+    """)
+    op.execute("""
+        INSERT INTO meeting_attendees (meeting_id, user_id, meeting_start_time)
+        SELECT a.meeting_id, a.user_id, m.start_time
+        FROM meeting_attendees_unpartitioned a
+        JOIN meetings_unpartitioned m ON m.id = a.meeting_id
+    """)
+    op.drop_table('meeting_attendees_unpartitioned')
+    op.drop_table('meetings_unpartitioned')
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE meeting_attendees RENAME TO meeting_attendees_partitioned")
+    op.execute("ALTER TABLE meetings RENAME TO meetings_partitioned")
+    op.execute("ALTER TABLE meetings_partitioned RENAME CONSTRAINT meetings_pkey TO meetings_partitioned_pkey")
+    op.execute("ALTER TABLE meeting_attendees_partitioned RENAME CONSTRAINT meeting_attendees_pkey TO meeting_attendees_partitioned_pkey")
+    op.drop_index('ix_meetings_id', table_name='meetings_partitioned')
+    op.drop_index('ix_meetings_start_time', table_name='meetings_partitioned')
+    op.drop_index('ix_meetings_end_time', table_name='meetings_partitioned')
+
+    op.execute("""
+        CREATE TABLE meetings (
+            id integer NOT NULL DEFAULT nextval('meetings_id_seq') PRIMARY KEY,
+            created_at timestamptz DEFAULT now(),
+            updated_at timestamptz,
+            title varchar(100) NOT NULL,
+            description varchar(500),
+            start_time timestamptz NOT NULL,
+            end_time timestamptz NOT NULL,
+            location varchar(100),
+            organizer_id integer NOT NULL REFERENCES users (id),
+            google_event_id varchar(255)
+        )
+    """)
+    op.execute("ALTER SEQUENCE meetings_id_seq OWNED BY meetings.id")
+    op.create_index('ix_meetings_id', 'meetings', ['id'])
+    op.create_index('ix_meetings_start_time', 'meetings', ['start_time'])
+    op.create_index('ix_meetings_end_time', 'meetings', ['end_time'])
+    op.create_table(
+        'meeting_attendees',
+        sa.Column('meeting_id', sa.Integer(), sa.ForeignKey('meetings.id'), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+    )
+
+    op.execute("""
+        INSERT INTO meetings (id, created_at, updated_at, title, description, start_time, end_time,
+                              location, organizer_id, google_event_id)
+        SELECT id, created_at, updated_at, title, description, start_time, end_time,
+               location, organizer_id, google_event_id
+        FROM meetings_partitioned
+    """)
+    op.execute("""
+        INSERT INTO meeting_attendees (meeting_id, user_id)
+        SELECT meeting_id, user_id FROM meeting_attendees_partitioned
+    """)
+    op.drop_table('meeting_attendees_partitioned')
+    op.drop_table('meetings_partitioned')
+    op.execute("DROP FUNCTION drop_meeting_partitions_before(timestamptz)")
+    op.execute("DROP FUNCTION create_meeting_partitions(date, date)")
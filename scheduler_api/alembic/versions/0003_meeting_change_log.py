@@ -0,0 +1,35 @@
+"""meeting change log for delta sync
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'meeting_changes',
+        sa.Column('id', sa.BigInteger(), primary_key=True),
+        sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('meeting_id', sa.Integer(), nullable=False),
+        sa.Column('op', sa.String(10), nullable=False),
+    )
+    op.create_index('ix_meeting_changes_user_id_id', 'meeting_changes', ['user_id', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_meeting_changes_user_id_id', table_name='meeting_changes')
+    op.drop_table('meeting_changes')
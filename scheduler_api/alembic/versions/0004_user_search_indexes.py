@@ -0,0 +1,36 @@
+"""indexes for user directory search
+
+Trigram GIN indexes serve substring matches on lower(email) and
+lower(full_name); text_pattern_ops btree indexes serve the prefix path.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX ix_users_email_trgm ON users USING gin (lower(email) gin_trgm_ops)")
+    op.execute("CREATE INDEX ix_users_full_name_trgm ON users USING gin (lower(full_name) gin_trgm_ops)")
+    op.execute("CREATE INDEX ix_users_email_prefix ON users (lower(email) text_pattern_ops)")
+    op.execute("CREATE INDEX ix_users_full_name_prefix ON users (lower(full_name) text_pattern_ops)")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_full_name_prefix', table_name='users')
+    op.drop_index('ix_users_email_prefix', table_name='users')
+    op.drop_index('ix_users_full_name_trgm', table_name='users')
+    op.drop_index('ix_users_email_trgm', table_name='users')
@@ -0,0 +1,61 @@
+"""organizations (tenants) on users and meetings
+
+Existing users and meetings move into a default organization. Email
+uniqueness becomes per organization. Run this on every shard; the
+default shard's organizations table is the tenant directory.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'organizations',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('slug', sa.String(50), nullable=False),
+        sa.Column('shard', sa.String(50), nullable=False, server_default='default'),
+    )
+    op.create_index('ix_organizations_id', 'organizations', ['id'])
+    op.create_index('ix_organizations_slug', 'organizations', ['slug'], unique=True)
+    op.execute("INSERT INTO organizations (id, name, slug) VALUES (1, 'Default', 'default')")
+    op.execute("SELECT setval(pg_get_serial_sequence('organizations', 'id'), 1)")
+
+    # The temporary default backfills existing rows; new rows must name their organization
+    for table in ('users', 'meetings'):
+        op.add_column(table, sa.Column('organization_id', sa.Integer(), nullable=False, server_default='1'))
+        op.alter_column(table, 'organization_id', server_default=None)
+        op.create_foreign_key(f'fk_{table}_organization_id', table, 'organizations', ['organization_id'], ['id'])
+        op.create_index(f'ix_{table}_organization_id', table, ['organization_id'])
+
+    op.drop_index('ix_users_email', table_name='users')
+    op.create_index('ix_users_email', 'users', ['email'])
+    op.create_unique_constraint('uq_users_organization_id_email', 'users', ['organization_id', 'email'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_users_organization_id_email', 'users', type_='unique')
+    op.drop_index('ix_users_email', table_name='users')
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    for table in ('meetings', 'users'):
+        op.drop_index(f'ix_{table}_organization_id', table_name=table)
+        op.drop_constraint(f'fk_{table}_organization_id', table, type_='foreignkey')
+        op.drop_column(table, 'organization_id')
+    op.drop_index('ix_organizations_slug', table_name='organizations')
+    op.drop_index('ix_organizations_id', table_name='organizations')
+    op.drop_table('organizations')
@@ -0,0 +1,43 @@
+"""full-text search over meeting title, description and location
+
+A stored generated tsvector column keeps itself in sync with the text
+columns, and a GIN index on it serves @@ matches. Adding the column
+rewrites every meetings partition once. Partitions created later need
+the column generated as well (see 0008).
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 16:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('meetings', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(location, '')), 'C')",
+            persisted=True
+        )
+    ))
+    op.create_index('ix_meetings_search_vector', 'meetings', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_meetings_search_vector', table_name='meetings')
+    op.drop_column('meetings', 'search_vector')
@@ -0,0 +1,76 @@
+"""commit-ordered versions for the meeting change log
+
+Change ids come from a sequence at insert time, so transactions can commit
+in a different order than their ids and a client that synced past an id
+could miss a lower one committed later. Rows now carry a version derived
+from the inserting transaction's id, and readers only serve versions below
+the oldest transaction still running (meeting_change_horizon()); every
+transaction below that horizon has finished, so nothing can appear behind
+a version once it has been handed out.
+
+Existing rows keep version = id. New versions are offset past the highest
+existing id, so versions clients already hold stay valid.
+
+meeting_change_log_state records the highest purged version; clients
+behind it must resync.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-20 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+VERSION_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION meeting_change_version() RETURNS bigint
+LANGUAGE sql VOLATILE AS $$
+    SELECT pg_current_xact_id()::text::bigint + {offset}
+$$;
+
+CREATE OR REPLACE FUNCTION meeting_change_horizon() RETURNS bigint
+LANGUAGE sql VOLATILE AS $$
+    SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint + {offset}
+$$;
+"""
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    offset = conn.execute(sa.text("SELECT COALESCE(MAX(id), 0) FROM meeting_changes")).scalar_one()
+    op.execute(VERSION_FUNCTIONS.format(offset=int(offset)))
+
+    op.add_column('meeting_changes', sa.Column('version', sa.BigInteger(), nullable=True))
+    op.execute("UPDATE meeting_changes SET version = id")
+    op.alter_column(
+        'meeting_changes', 'version',
+        nullable=False, server_default=sa.text('meeting_change_version()')
+    )
+    op.create_index('ix_meeting_changes_user_id_version', 'meeting_changes', ['user_id', 'version'])
+    op.drop_index('ix_meeting_changes_user_id_id', table_name='meeting_changes')
+
+    op.create_table(
+        'meeting_change_log_state',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('purged_through', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+    op.execute("INSERT INTO meeting_change_log_state (id, purged_through) VALUES (1, 0)")
+
+
+def downgrade() -> None:
+    op.drop_table('meeting_change_log_state')
+    op.create_index('ix_meeting_changes_user_id_id', 'meeting_changes', ['user_id', 'id'])
+    op.drop_index('ix_meeting_changes_user_id_version', table_name='meeting_changes')
+    op.drop_column('meeting_changes', 'version')
+    op.execute("DROP FUNCTION meeting_change_horizon()")
+    op.execute("DROP FUNCTION meeting_change_version()")
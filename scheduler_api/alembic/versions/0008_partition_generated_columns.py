@@ -0,0 +1,154 @@
+"""create meeting partitions with the generated search column
+
+create_meeting_partitions (0002) built each month with
+LIKE meetings INCLUDING DEFAULTS, which copies search_vector (0006) as a
+plain column; attaching such a table fails because a partition's column
+must be generated when the parent's is, so new months were never created
+and their meetings stayed in meetings_default. The function now copies
+generated columns too and moves rows out of the default partition
+without the generated ones, which Postgres recomputes.
+
+The upgrade creates a partition for a far-off month inside a savepoint
+and rolls it back, so a function that cannot attach partitions fails the
+migration instead of the maintenance job.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-20 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CREATE_PARTITIONS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION create_meeting_partitions(from_month date, to_month date)
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start date := date_trunc('month', from_month)::date;
+    lower_bound timestamptz;
+    upper_bound timestamptz;
+    suffix text;
+    created integer := 0;
+    -- Generated columns (search_vector) are recomputed, not copied
+    meeting_columns text := (
+        SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum)
+        FROM pg_attribute
+        WHERE attrelid = 'meetings'::regclass AND attnum > 0 AND NOT attisdropped AND attgenerated = ''
+    );
+BEGIN
+    WHILE month_start < to_month LOOP
+        suffix := to_char(month_start, '"y"YYYY"m"MM');
+        lower_bound := month_start::timestamp AT TIME ZONE 'UTC';
+        upper_bound := (month_start + interval '1 month')::timestamp AT TIME ZONE 'UTC';
+        IF to_regclass('meetings_' || suffix) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I (LIKE meetings INCLUDING DEFAULTS INCLUDING GENERATED)', 'meetings_' || suffix);
+            EXECUTE format('CREATE TABLE %I (LIKE meeting_attendees INCLUDING DEFAULTS)', 'meeting_attendees_' || suffix);
+            -- Rows stored in the default partitions before this month existed move over
+            EXECUTE format(
+                'INSERT INTO %I (%s) SELECT %s FROM meetings_default WHERE start_time >= $1 AND start_time < $2',
+                'meetings_' || suffix, meeting_columns, meeting_columns
+            ) USING lower_bound, upper_bound;
+            EXECUTE format(
+                'INSERT INTO %I SELECT * FROM meeting_attendees_default '
+                'WHERE meeting_start_time >= $1 AND meeting_start_time < $2',
+                'meeting_attendees_' || suffix
+            ) USING lower_bound, upper_bound;
+            DELETE FROM meeting_attendees_default
+                WHERE meeting_start_time >= lower_bound AND meeting_start_time < upper_bound;
+            DELETE FROM meetings_default
+                WHERE start_time >= lower_bound AND start_time < upper_bound;
+            EXECUTE format(
+                'ALTER TABLE meetings ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                'meetings_' || suffix, lower_bound, upper_bound
+            );
+            EXECUTE format(
+                'ALTER TABLE meeting_attendees ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                'meeting_attendees_' || suffix, lower_bound, upper_bound
+            );
+            created := created + 1;
+        END IF;
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END
+$$;
+"""
+
+
+# As defined by 0002
+PREVIOUS_PARTITIONS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION create_meeting_partitions(from_month date, to_month date)
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start date := date_trunc('month', from_month)::date;
+    lower_bound timestamptz;
+    upper_bound timestamptz;
+    suffix text;
+    created integer := 0;
+BEGIN
+    WHILE month_start < to_month LOOP
+        suffix := to_char(month_start, '"y"YYYY"m"MM');
+        lower_bound := month_start::timestamp AT TIME ZONE 'UTC';
+        upper_bound := (month_start + interval '1 month')::timestamp AT TIME ZONE 'UTC';
+        IF to_regclass('meetings_' || suffix) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I (LIKE meetings INCLUDING DEFAULTS)', 'meetings_' || suffix);
+            EXECUTE format('CREATE TABLE %I (LIKE meeting_attendees INCLUDING DEFAULTS)', 'meeting_attendees_' || suffix);
+            -- Rows stored in the default partitions before this month existed move over
+            EXECUTE format(
+                'INSERT INTO %I SELECT * FROM meetings_default WHERE start_time >= $1 AND start_time < $2',
+                'meetings_' || suffix
+            ) USING lower_bound, upper_bound;
+            EXECUTE format(
+                'INSERT INTO %I SELECT * FROM meeting_attendees_default '
+                'WHERE meeting_start_time >= $1 AND meeting_start_time < $2',
+                'meeting_attendees_' || suffix
+            ) USING lower_bound, upper_bound;
+            DELETE FROM meeting_attendees_default
+                WHERE meeting_start_time >= lower_bound AND meeting_start_time < upper_bound;
+            DELETE FROM meetings_default
+                WHERE start_time >= lower_bound AND start_time < upper_bound;
+            EXECUTE format(
+                'ALTER TABLE meetings ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                'meetings_' || suffix, lower_bound, upper_bound
+            );
+            EXECUTE format(
+                'ALTER TABLE meeting_attendees ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                'meeting_attendees_' || suffix, lower_bound, upper_bound
+            );
+            created := created + 1;
+        END IF;
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    if context.is_offline_mode():
+        return
+    op.execute("SAVEPOINT partition_check")
+    created = op.get_bind().execute(sa.text(
+        "SELECT create_meeting_partitions(DATE '2999-01-01', DATE '2999-02-01')"
+    )).scalar_one()
+    op.execute("ROLLBACK TO SAVEPOINT partition_check")
+    if created != 1:
+        raise RuntimeError(f"create_meeting_partitions created {created} partitions for an empty month, expected 1")
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_PARTITIONS_FUNCTION)
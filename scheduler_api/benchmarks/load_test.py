@@ -0,0 +1,176 @@
+"""
+HTTP load generator for a running API seeded with benchmarks.seed_data.
+
+Logs in as the seeded users, then keeps a fixed number of concurrent
+clients issuing a weighted mix of dashboard listings, availability checks
+and bookings for a set duration. Prints throughput and p50/p95/p99 latency
+per route as JSON, tagged with the current git revision so runs can be
+compared across commits. Needs ``httpx``.
+
+Raise RATE_LIMIT_PER_SECOND / RATE_LIMIT_BURST on the server first, or
+most requests will measure the rate limiter's 429s.
+
+    cd scheduler_api
+    python -m benchmarks.load_test --base-url http://localhost:8000 \\
+        --users 200 --concurrency 50 --duration 60 --output results.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+import httpx
+from benchmarks.common import summarize, git_revision
+from benchmarks.seed_data import EMAIL_TEMPLATE, DEFAULT_PASSWORD
+
+LOGIN = "POST /auth/login"
+LIST = "GET /meetings/"
+AVAILABILITY = "GET /availability/availability/{email}"
+CREATE = "POST /meetings/"
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+
+    async def call(self, route: str, request):
+        started = time.perf_counter()
+        try:
+            response = await request
+            status = response.status_code
+        except httpx.HTTPError as e:
+            response, status = None, type(e).__name__
+        self.latencies[route].append(time.perf_counter() - started)
+        self.statuses[route][str(status)] += 1
+        return response
+
+    def report(self, elapsed: float) -> dict:
+        routes = {}
+        for route, samples in sorted(self.latencies.items()):
+            statuses = self.statuses[route]
+            errors = sum(n for s, n in statuses.items() if not s.isdigit() or int(s) >= 500)
+            routes[route] = {
+                **summarize(samples),
+                "requests_per_second": round(len(samples) / elapsed, 1),
+                "errors": errors,
+                "statuses": dict(statuses),
+            }
+        return routes
+
+
+async def login_all(client, recorder: Recorder, emails: list[str], password: str, concurrency: int) -> dict:
+    tokens = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login(email):
+        async with semaphore:
+            response = await recorder.call(LOGIN, client.post(
+                "/auth/login", data={"username": email, "password": password}
+            ))
+            if response is not None and response.status_code == 200:
+                tokens[email] = response.json()["access_token"]
+
+    await asyncio.gather(*(login(e) for e in emails))
+    return tokens
+
+
+async def run_mix(client, recorder: Recorder, tokens: dict, args, deadline: float):
+    emails = list(tokens)
+    weights = [args.list_weight, args.availability_weight, args.create_weight]
+    rng = random.Random()
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    async def one_request():
+        email = rng.choice(emails)
+        headers = {"Authorization": f"Bearer {tokens[email]}"}
+        kind = rng.choices((LIST, AVAILABILITY, CREATE), weights)[0]
+        week_start = today + timedelta(weeks=rng.randrange(args.weeks))
+        if kind == LIST:
+            params = {"start": week_start.isoformat(), "end": (week_start + timedelta(days=7)).isoformat()}
+            await recorder.call(LIST, client.get("/meetings/", params=params, headers=headers))
+        elif kind == AVAILABILITY:
+            other = rng.choice(emails)
+            start = week_start + timedelta(days=rng.randrange(5), hours=8 + rng.randrange(10))
+            params = {"start": start.isoformat(), "end": (start + timedelta(minutes=30)).isoformat()}
+            await recorder.call(AVAILABILITY, client.get(f"/availability/availability/{other}", params=params, headers=headers))
+        else:
+            start = week_start + timedelta(days=rng.randrange(5), hours=8, minutes=30 * rng.randrange(20))
+            body = {
+                "title": "Load test",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(minutes=30)).isoformat(),
+                "attendee_emails": [email] + rng.sample(emails, min(len(emails), args.fanout)),
+            }
+            await recorder.call(CREATE, client.post("/meetings/", json=body, params={"alternatives": 0}, headers=headers))
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            await one_request()
+
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+
+
+async def run(args) -> dict:
+    emails = [EMAIL_TEMPLATE.format(i) for i in range(args.users)]
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        recorder = Recorder()
+        tokens = await login_all(client, recorder, emails, args.password, args.concurrency)
+        if not tokens:
+            raise SystemExit("No seeded user could log in; run benchmarks.seed_data first")
+        started = time.perf_counter()
+        await run_mix(client, recorder, tokens, args, started + args.duration)
+        elapsed = time.perf_counter() - started
+
+    routes = recorder.report(elapsed)
+    # Logins ran before the timed phase; their rate is not comparable
+    routes[LOGIN].pop("requests_per_second", None)
+    total = sum(r["count"] for name, r in routes.items() if name != LOGIN)
+    return {
+        "revision": git_revision(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "base_url": args.base_url,
+            "users": len(tokens),
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "mix": {LIST: args.list_weight, AVAILABILITY: args.availability_weight, CREATE: args.create_weight},
+        },
+        "requests": total,
+        "requests_per_second": round(total / elapsed, 1),
+        "routes": routes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=100, help="seeded users to log in as")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30, help="seconds of mixed load")
+    parser.add_argument("--timeout", type=float, default=30, help="per-request timeout in seconds")
+    parser.add_argument("--weeks", type=int, default=8, help="weeks ahead that requests target")
+    parser.add_argument("--fanout", type=int, default=2, help="extra attendees on created meetings")
+    parser.add_argument("--list-weight", type=int, default=60)
+    parser.add_argument("--availability-weight", type=int, default=30)
+    parser.add_argument("--create-weight", type=int, default=10)
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    errors = sum(r["errors"] for r in report["routes"].values())
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+Query-level micro-benchmarks for the conflict and CRUD hot paths.
+
+For each dataset size, seeds benchmark data with benchmarks.seed_data,
+then calls these functions directly, bypassing HTTP:
+
+- has_time_conflict
+- get_user_meetings_in_range
+- create_meeting
+- update_meeting
+
+Every call runs inside an outer transaction that is rolled back, so writes
+leave the dataset unchanged between iterations. The SQL issued by the first
+call of each operation is captured and replayed under
+``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)``, again in a rolled-back
+transaction.
+
+The report flags these plan problems:
+- sequential scans over meetings or meeting_attendees that touch many rows
+- with --baseline, indexes the baseline used but this run no longer does
+- with --baseline, p50 latencies that grew beyond --slowdown
+
+The script exits non-zero when anything is flagged.
+
+    cd scheduler_api
+    python -m benchmarks.query_bench --sizes 10000,100000,1000000 --output query_bench.json
+    python -m benchmarks.query_bench --sizes 100000 --no-seed --baseline query_bench.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from datetime import timedelta
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from benchmarks import seed_data
+from benchmarks.common import summarize, git_revision
+from core.database import async_engine
+from crud.meeting import create_meeting, update_meeting, get_user_meetings_in_range
+from models import Meeting, User
+from schemas import MeetingCreate, MeetingUpdate
+from services.conflict_checker import has_time_conflict
+
+WATCHED_RELATIONS = ("meetings", "meeting_attendees")
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+# Monthly partitions differ between runs; compare their indexes by parent name
+PARTITION_SUFFIX = re.compile(r"_y\d{4}m\d{2}")
+
+_captured = None
+
+
+@event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+def _capture_statement(conn, cursor, statement, parameters, context, executemany):
+    if _captured is not None:
+        # EXPLAIN takes one parameter set; executemany statements replay the first
+        params = parameters[0] if executemany and parameters else parameters
+        if isinstance(params, list):
+            params = tuple(params)
+        _captured.append({"statement": statement, "parameters": params, "executemany": executemany})
+
+
+def plan_facts(node: dict, facts: dict, seq_scan_min_rows: int):
+    """Collect node types, indexes and large scans of watched tables from a plan tree."""
+    facts["node_types"].add(node["Node Type"])
+    if node.get("Index Name"):
+        facts["indexes"].add(PARTITION_SUFFIX.sub("_yYYYYmMM", node["Index Name"]))
+    relation = PARTITION_SUFFIX.sub("_yYYYYmMM", node.get("Relation Name", ""))
+    if node["Node Type"] == "Seq Scan" and relation.startswith(WATCHED_RELATIONS):
+        rows = (node.get("Actual Rows", 0) + node.get("Rows Removed by Filter", 0)) * node.get("Actual Loops", 1)
+        if rows >= seq_scan_min_rows:
+            facts["flags"].add(f"seq_scan:{relation}")
+    for child in node.get("Plans", []):
+        plan_facts(child, facts, seq_scan_min_rows)
+
+
+async def explain(statements: list[dict], seq_scan_min_rows: int) -> list[dict]:
+    plans = []
+    async with async_engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            for captured in statements:
+                sql = captured["statement"]
+                if not sql.lstrip().upper().startswith(EXPLAINABLE):
+                    continue
+                entry = {"statement": " ".join(sql.split())[:300], "executemany": captured["executemany"]}
+                savepoint = await conn.begin_nested()
+                try:
+                    result = await conn.exec_driver_sql(
+                        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, captured["parameters"]
+                    )
+                    plan = result.scalar()
+                    plan = json.loads(plan) if isinstance(plan, str) else plan
+                    await savepoint.commit()
+                except Exception as e:
+                    await savepoint.rollback()
+                    entry["error"] = str(e).splitlines()[0]
+                    plans.append(entry)
+                    continue
+                root = plan[0]
+                facts = {"node_types": set(), "indexes": set(), "flags": set()}
+                plan_facts(root["Plan"], facts, seq_scan_min_rows)
+                entry.update({
+                    "planning_ms": root.get("Planning Time"),
+                    "execution_ms": root.get("Execution Time"),
+                    "shared_hit_blocks": root["Plan"].get("Shared Hit Blocks"),
+                    "shared_read_blocks": root["Plan"].get("Shared Read Blocks"),
+                    "node_types": sorted(facts["node_types"]),
+                    "indexes": sorted(facts["indexes"]),
+                    "flags": sorted(facts["flags"]),
+                    "plan": root["Plan"],
+                })
+                plans.append(entry)
+        finally:
+            await transaction.rollback()
+    return plans
+
+
+async def run_operation(make_call, iterations: int, seq_scan_min_rows: int) -> dict:
+    """Time ``make_call(session)`` in rolled-back transactions and explain the first call's SQL."""
+    global _captured
+    timings = []
+    outcomes = {}
+    first_statements = None
+    for i in range(iterations):
+        async with async_engine.connect() as conn:
+            transaction = await conn.begin()
+            session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+            if i == 0:
+                _captured = []
+            started = time.perf_counter()
+            try:
+                await make_call(session, i)
+                outcome = "ok"
+            except ValueError as e:
+                outcome = type(e).__name__
+            finally:
+                timings.append(time.perf_counter() - started)
+                if i == 0:
+                    first_statements, _captured = _captured, None
+                await session.close()
+                await transaction.rollback()
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    plans = await explain(first_statements or [], seq_scan_min_rows)
+    flags = sorted({flag for plan in plans for flag in plan.get("flags", [])})
+    return {**summarize(timings), "outcomes": outcomes, "plans": plans, "flags": flags}
+
+
+async def sample_inputs(rng: random.Random, count: int) -> dict:
+    """Seeded users and meetings to aim the operations at."""
+    async with AsyncSession(async_engine) as db:
+        users = (await db.execute(
+            select(User.id, User.email)
+            .where(User.email.like(seed_data.EMAIL_TEMPLATE.format("%")))
+            .order_by(func.random())
+            .limit(count * 3)
+        )).all()
+        meetings = (await db.execute(
+            select(Meeting.id, Meeting.start_time, Meeting.end_time)
+            .where(Meeting.organizer_id.in_([u.id for u in users]))
+            .order_by(func.random())
+            .limit(count)
+        )).all()
+        first = (await db.execute(
+            select(func.min(Meeting.start_time)).where(Meeting.organizer_id.in_([u.id for u in users]))
+        )).scalar()
+    if not users or not meetings or first is None:
+        raise SystemExit("No seeded data found; run without --no-seed or run benchmarks.seed_data")
+    return {"users": users, "meetings": meetings, "first_day": first.replace(hour=0, minute=0, second=0, microsecond=0)}
+
+
+async def bench_size(args, size: int, rng: random.Random) -> dict:
+    seeded = None
+    if not args.no_seed:
+        seed_args = argparse.Namespace(
+            users=max(10, size // args.meetings_per_user), meetings_per_user=args.meetings_per_user,
+            fanout=args.fanout, team_size=12, recurring_fraction=0.3, series_length=8,
+            weeks=args.weeks, password=seed_data.DEFAULT_PASSWORD, seed=args.seed
+        )
+        seeded = await seed_data.run(seed_args, dispose=False)
+    inputs = await sample_inputs(rng, args.iterations)
+    users, meetings, first_day = inputs["users"], inputs["meetings"], inputs["first_day"]
+
+    def pick_users(n):
+        return rng.sample(users, min(n, len(users)))
+
+    def working_slot():
+        day = first_day + timedelta(weeks=rng.randrange(args.weeks), days=rng.randrange(5))
+        return day + timedelta(hours=8 + rng.randrange(10))
+
+    def evening_slot():
+        # Seeded meetings stay within working hours, so these bookings succeed
+        day = first_day + timedelta(weeks=rng.randrange(args.weeks), days=rng.randrange(5))
+        return day + timedelta(hours=19, minutes=30 * rng.randrange(4))
+
+    async def conflict_call(db, i):
+        start = working_slot()
+        await has_time_conflict(db, start, start + timedelta(minutes=30), [u.id for u in pick_users(3)])
+
+    async def range_call(db, i):
+        week = first_day + timedelta(weeks=rng.randrange(args.weeks))
+        await get_user_meetings_in_range(db, rng.choice(users).id, week, week + timedelta(days=7))
+
+    async def create_call(db, i):
+        start = evening_slot()
+        invited = pick_users(args.fanout + 1)
+        meeting = MeetingCreate(
+            title="Query bench", start_time=start, end_time=start + timedelta(minutes=30),
+            attendee_emails=[u.email for u in invited]
+        )
+        await create_meeting(db, meeting, invited[0].id, alternatives=0)
+
+    async def update_call(db, i):
+        target = meetings[i % len(meetings)]
+        start = evening_slot()
+        duration = target.end_time - target.start_time
+        await update_meeting(
+            db, target.id,
+            MeetingUpdate(id=target.id, title="Query bench", start_time=start, end_time=start + duration),
+            alternatives=0
+        )
+
+    operations = {
+        "has_time_conflict": conflict_call,
+        "get_user_meetings_in_range": range_call,
+        "create_meeting": create_call,
+        "update_meeting": update_call,
+    }
+    results = {}
+    for name, call in operations.items():
+        results[name] = await run_operation(call, args.iterations, args.seq_scan_min_rows)
+    async with AsyncSession(async_engine) as db:
+        total = (await db.execute(select(func.count()).select_from(Meeting))).scalar()
+    return {"meetings_in_database": total, "seeded": seeded, "operations": results}
+
+
+def compare(report: dict, baseline: dict, slowdown: float) -> list[str]:
+    """Regressions of this report against a baseline report of the same sizes."""
+    regressions = []
+    for size, result in report["sizes"].items():
+        base = baseline.get("sizes", {}).get(size)
+        for op, current in result["operations"].items():
+            for flag in current["flags"]:
+                regressions.append(f"{size}/{op}: {flag}")
+            previous = base and base["operations"].get(op)
+            if not previous:
+                continue
+            lost = set().union(*[p.get("indexes", []) for p in previous["plans"]]) - \
+                set().union(*[p.get("indexes", []) for p in current["plans"]])
+            for index in sorted(lost):
+                regressions.append(f"{size}/{op}: lost_index:{index}")
+            if previous.get("p50_ms") and current.get("p50_ms", 0) > previous["p50_ms"] * (1 + slowdown):
+                regressions.append(f"{size}/{op}: p50 {previous['p50_ms']}ms -> {current['p50_ms']}ms")
+    return regressions
+
+
+async def run(args) -> dict:
+    rng = random.Random(args.seed)
+    sizes = {}
+    try:
+        for size in args.sizes:
+            sizes[str(size)] = await bench_size(args, size, rng)
+    finally:
+        await async_engine.dispose()
+    return {"revision": git_revision(), "iterations": args.iterations, "sizes": sizes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=lambda v: [int(s) for s in v.split(",")], default=[10_000, 100_000],
+                        help="comma-separated meeting counts to seed and benchmark")
+    parser.add_argument("--no-seed", action="store_true", help="benchmark the data already in the database")
+    parser.add_argument("--meetings-per-user", type=int, default=20)
+    parser.add_argument("--fanout", type=int, default=3)
+    parser.add_argument("--weeks", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--seq-scan-min-rows", type=int, default=1000,
+                        help="flag sequential scans of watched tables touching at least this many rows")
+    parser.add_argument("--baseline", help="earlier report to compare plans and latencies against")
+    parser.add_argument("--slowdown", type=float, default=0.25, help="tolerated p50 growth against the baseline")
+    parser.add_argument("--full-plans", action="store_true", help="keep complete plan trees in the report")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    report["regressions"] = compare(report, baseline, args.slowdown)
+    if not args.full_plans:
+        for result in report["sizes"].values():
+            for op in result["operations"].values():
+                for plan in op["plans"]:
+                    plan.pop("plan", None)
+
+    text = json.dumps(report, indent=2, default=str)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    sys.exit(1 if report["regressions"] else 0)
+
+
+if __name__ == "__main__":
+    main()
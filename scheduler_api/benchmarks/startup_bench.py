@@ -0,0 +1,140 @@
+"""
+Cold-start benchmark: how long a fresh interpreter takes to ``import main``.
+
+Each run starts a new ``python -X importtime`` process, so nothing is
+shared between runs. The report gives the p50 import time and, per module,
+the median self and cumulative import time. It also sums self time per
+top-level package, which shows where third-party cost comes from. No
+database is needed, because importing the app does not connect.
+
+The report flags:
+- modules from --forbid (heavy optional libraries that must stay lazy)
+  that were imported at startup
+- with --baseline, a p50 import time that grew beyond --slowdown
+
+The script exits non-zero when anything is flagged.
+
+    cd scheduler_api
+    python -m benchmarks.startup_bench --runs 10 --output startup.json
+    python -m benchmarks.startup_bench --baseline startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from benchmarks.common import summarize, git_revision
+
+# Only needed by optional features; importing them at startup is a regression
+DEFAULT_FORBIDDEN = [
+    "googleapiclient", "google.oauth2", "httplib2", "psycopg2",
+    "opentelemetry.sdk", "pyinstrument", "alembic", "redis.asyncio",
+]
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """module -> (self us, cumulative us) from ``-X importtime`` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def one_run(module: str) -> tuple[float, dict]:
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return elapsed, parse_importtime(result.stderr)
+
+
+def run(args) -> dict:
+    wall, imported = [], []
+    for _ in range(args.runs):
+        elapsed, modules = one_run(args.module)
+        wall.append(elapsed)
+        imported.append(modules)
+
+    samples = defaultdict(list)
+    for modules in imported:
+        for name, times in modules.items():
+            samples[name].append(times)
+    per_module = {
+        name: {
+            "self_ms": round(statistics.median(s for s, _ in times) / 1000, 2),
+            "cumulative_ms": round(statistics.median(c for _, c in times) / 1000, 2),
+        }
+        for name, times in samples.items()
+    }
+    packages = defaultdict(float)
+    for name, times in per_module.items():
+        packages[name.split(".")[0]] += times["self_ms"]
+
+    import_ms = [m[args.module][1] / 1_000_000 for m in imported]
+    forbidden = sorted(
+        f for f in args.forbid
+        if any(name == f or name.startswith(f + ".") for name in per_module)
+    )
+    return {
+        "revision": git_revision(),
+        "module": args.module,
+        "runs": args.runs,
+        "import": summarize(import_ms),
+        "process": summarize(wall),
+        "modules_imported": len(per_module),
+        "top_modules": dict(sorted(per_module.items(), key=lambda kv: -kv[1]["cumulative_ms"])[:args.top]),
+        "packages": {k: round(v, 2) for k, v in sorted(packages.items(), key=lambda kv: -kv[1])[:args.top]},
+        "forbidden_imported": forbidden,
+    }
+
+
+def compare(report: dict, baseline: dict, slowdown: float) -> list[str]:
+    """Regressions of this report, against a baseline report when given."""
+    regressions = [f"imported at startup: {name}" for name in report["forbidden_imported"]]
+    previous = baseline.get("import", {}).get("p50_ms")
+    current = report["import"].get("p50_ms", 0)
+    if previous and current > previous * (1 + slowdown):
+        regressions.append(f"import p50 {previous}ms -> {current}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="module to import, from the scheduler_api directory")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=25, help="modules and packages to list")
+    parser.add_argument("--forbid", type=lambda v: [s for s in v.split(",") if s], default=DEFAULT_FORBIDDEN,
+                        help="comma-separated modules that must not be imported at startup")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--slowdown", type=float, default=0.2, help="tolerated p50 growth against the baseline")
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args()
+
+    report = run(args)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    report["regressions"] = compare(report, baseline, args.slowdown)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    sys.exit(1 if report["regressions"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import time
+import functools
+from prometheus_client import Counter, Gauge, Histogram, REGISTRY
+from prometheus_client.core import GaugeMetricFamily, CounterMetricFamily
+
+# Buckets in seconds, from sub-millisecond cache hits to slow external calls
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to produce a response, by route template",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Responses sent, by route template and status code",
+    ["method", "route", "status"]
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests currently being handled"
+)
+
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time to obtain a pooled connection, including waiting and opening new ones",
+    buckets=LATENCY_BUCKETS
+)
+
+BACKGROUND_JOB_DURATION = Histogram(
+    "background_job_duration_seconds",
+    "Duration of periodic background jobs",
+    ["job"],
+    buckets=LATENCY_BUCKETS + (30, 60, 300)
+)
+BACKGROUND_JOB_LAST_RUN = Gauge(
+    "background_job_last_run_timestamp_seconds",
+    "Unix time at which each background job last finished",
+    ["job"]
+)
+
+CALENDAR_ADAPTER_DURATION = Histogram(
+    "calendar_adapter_call_duration_seconds",
+    "Latency of external calendar API calls",
+    ["operation", "outcome"],
+    buckets=LATENCY_BUCKETS
+)
+
+CONFLICT_CHECKS = Counter(
+    "conflict_checks_total",
+    "Time-conflict checks, by whether an overlap was found",
+    ["result"]
+)
+
+
+def timed_job(name: str):
+    """Record the duration of an async background job."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                BACKGROUND_JOB_DURATION.labels(name).observe(time.perf_counter() - started)
+                BACKGROUND_JOB_LAST_RUN.labels(name).set_to_current_time()
+        return wrapper
+    return decorator
+
+
+class PoolCollector:
+    """Reads SQLAlchemy pool occupancy at scrape time instead of tracking every checkout."""
+
+    def __init__(self, engine):
+        self.pool = engine.sync_engine.pool
+
+    def collect(self):
+        size = GaugeMetricFamily("db_pool_size", "Configured persistent connections in the pool")
+        size.add_metric([], self.pool.size())
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "Connections currently in use")
+        checked_out.add_metric([], self.pool.checkedout())
+        checked_in = GaugeMetricFamily("db_pool_checked_in", "Idle connections in the pool")
+        checked_in.add_metric([], self.pool.checkedin())
+        # QueuePool reports overflow relative to pool_size, so it is negative until the pool is full
+        overflow = GaugeMetricFamily("db_pool_overflow", "Connections open beyond the pool size")
+        overflow.add_metric([], max(0, self.pool.overflow()))
+        return [size, checked_out, checked_in, overflow]
+
+
+class SingleFlightCollector:
+    """Exposes request-coalescing counters kept by services.single_flight."""
+
+    def __init__(self, flights):
+        self.flights = flights
+
+    def collect(self):
+        executed = CounterMetricFamily("single_flight_executed", "Queries run by a single-flight group", labels=["flight"])
+        coalesced = CounterMetricFamily("single_flight_coalesced", "Callers that shared another caller's query", labels=["flight"])
+        for flight in self.flights:
+            executed.add_metric([flight.name], flight.executed)
+            coalesced.add_metric([flight.name], flight.coalesced)
+        return [executed, coalesced]
+
+
+def register_collectors(engine, flights):
+    """Register scrape-time collectors; call once at startup."""
+    REGISTRY.register(PoolCollector(engine))
+    REGISTRY.register(SingleFlightCollector(flights))
@@ -0,0 +1,119 @@
+import os
+import re
+import time
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from core.tracing import tracer, TRACING_ENABLED
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Statements slower than this are logged, with their parameters redacted
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+# Dev mode: warn when one request runs the same statement shape this many times
+SQL_REPEAT_WARNINGS = os.getenv("SQL_REPEAT_WARNINGS", "false").lower() == "true"
+SQL_REPEAT_THRESHOLD = int(os.getenv("SQL_REPEAT_THRESHOLD", "5"))
+
+# Expanded IN lists render one placeholder per value; collapse them so
+# "IN ($1, $2)" and "IN ($1, $2, $3)" count as the same shape
+_PLACEHOLDER_LIST = re.compile(r"\$\d+(?:\s*,\s*\$\d+)*|%\([^)]+\)s(?:\s*,\s*%\([^)]+\)s)*|\?(?:\s*,\s*\?)*")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """SQL text with literals and placeholder lists replaced by '?'."""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def redact_parameters(parameters, executemany: bool) -> str:
+    """Describe bound parameters by type only, so values never reach the logs."""
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(v).__name__ for v in parameters) + ")"
+    return "()"
+
+
+class RequestQueryStats:
+    """Statement count and database time accumulated over one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+        if SQL_REPEAT_WARNINGS:
+            self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self) -> list[tuple[str, int]]:
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= SQL_REPEAT_THRESHOLD]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries"'
+
+
+# Set by QueryStatsMiddleware; tasks spawned during the request (single-flight
+# queries, BaseHTTPMiddleware's call_next) copy the context and share the object
+current_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+    if TRACING_ENABLED:
+        span = tracer.start_span(
+            statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL",
+            kind=SpanKind.CLIENT,
+            attributes={"db.system": conn.dialect.name, "db.statement": statement_shape(statement)[:2000]}
+        )
+        conn.info.setdefault("query_spans", []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    if TRACING_ENABLED:
+        conn.info["query_spans"].pop().end()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        logger.warning(
+            f"Slow query ({elapsed * 1000:.1f} ms): {statement_shape(statement)} "
+            f"params={redact_parameters(parameters, executemany)}"
+        )
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute does not fire for failed statements
+    info = exception_context.connection.info if exception_context.connection else {}
+    if info.get("query_start_time"):
+        info["query_start_time"].pop()
+    if info.get("query_spans"):
+        span = info["query_spans"].pop()
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+
+def instrument_engine(engine):
+    """Attach the statement timing hooks to an (async) engine; call once at startup."""
+    target = getattr(engine, "sync_engine", engine)
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    event.listen(target, "handle_error", _handle_error)
@@ -0,0 +1,147 @@
+import os
+import time
+import asyncio
+import logging
+import itertools
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from core.database import AsyncSessionLocal, ENGINE_OPTIONS
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Comma-separated read replicas of the default shard (POSTGRES_URI); reads use the primary when empty
+REPLICA_URIS = [uri.strip() for uri in os.getenv("REPLICA_URIS", "").split(",") if uri.strip()]
+# Replicas further behind than this are taken out of rotation
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_HEALTH_INTERVAL_SECONDS = float(os.getenv("REPLICA_HEALTH_INTERVAL_SECONDS", "5"))
+# After a user's own write, their reads stay on the primary this long (read-your-writes)
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+
+# Zero when caught up, even on an idle primary where the last replayed commit is old;
+# a server that is not in recovery (a plain second Postgres in tests) reports zero too.
+# NULL when the WAL receiver is not streaming: a detached replica has replayed all it
+# received and would otherwise look caught up. Reading pg_stat_wal_receiver's status
+# needs a role with pg_monitor (or pg_read_all_stats).
+REPLICATION_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class Replica:
+    def __init__(self, uri: str):
+        self.engine = create_async_engine(uri, **ENGINE_OPTIONS)
+        self.name = self.engine.url.render_as_string(hide_password=True)
+        self.healthy = True
+        self.lag_seconds = 0.0
+        self.error = None
+
+
+class ReplicaRouter:
+    """
+    Hands out read sessions on the replicas in round-robin order, skipping any
+    the health check marked down or lagging, and on the primary when none is
+    usable or the user wrote recently. Stickiness is tracked per process, so
+    behind a load balancer it holds for the node that took the write.
+    """
+
+    def __init__(self, uris: list[str], max_sticky_users: int = 100_000):
+        self.replicas = [Replica(uri) for uri in uris]
+        self.max_sticky_users = max_sticky_users
+        self._order = itertools.count()
+        self._sticky_until = {}
+        self._health_task = None
+
+    def note_write(self, user_key: Optional[tuple]):
+        """Keep reads of ``user_key`` (see dependencies.request_user_key) on the primary for a while."""
+        if not self.replicas or not user_key:
+            return
+        now = time.monotonic()
+        self._sticky_until[user_key] = now + REPLICA_STICKY_SECONDS
+        if len(self._sticky_until) > self.max_sticky_users:
+            self._sticky_until = {k: v for k, v in self._sticky_until.items() if v > now}
+
+    def _is_sticky(self, user_key: Optional[tuple]) -> bool:
+        return user_key is not None and self._sticky_until.get(user_key, 0) > time.monotonic()
+
+    def pick(self, user_key: Optional[tuple] = None) -> Optional[Replica]:
+        """Next healthy replica for this user's reads, or None to use the primary."""
+        if not self.replicas or self._is_sticky(user_key):
+            return None
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._order) % len(self.replicas)]
+            if replica.healthy:
+                return replica
+        return None
+
+    def session(self, user_key: Optional[tuple] = None, organization_id: Optional[int] = None) -> AsyncSession:
+        info = {"organization_id": organization_id}
+        replica = self.pick(user_key)
+        if replica is None:
+            return AsyncSessionLocal(info=info)
+        return AsyncSessionLocal(bind=replica.engine, info=info)
+
+    async def check(self):
+        """Probe every replica once, updating health and lag."""
+        async def probe(replica: Replica):
+            try:
+                async with replica.engine.connect() as conn:
+                    lag = (await conn.execute(REPLICATION_LAG_QUERY)).scalar_one()
+                if lag is None:
+                    healthy, error = False, "WAL receiver not streaming from the primary"
+                else:
+                    lag = float(lag)
+                    healthy, error = lag <= REPLICA_MAX_LAG_SECONDS, None
+            except Exception as e:
+                lag, healthy, error = None, False, str(e)
+            if healthy != replica.healthy:
+                state = "back in rotation" if healthy else f"out of rotation (lag={lag}, error={error})"
+                logger.warning(f"Replica {replica.name} {state}")
+            replica.healthy, replica.lag_seconds, replica.error = healthy, lag, error
+
+        await asyncio.gather(*(probe(r) for r in self.replicas))
+
+    async def _health_loop(self):
+        while True:
+            await self.check()
+            await asyncio.sleep(REPLICA_HEALTH_INTERVAL_SECONDS)
+
+    def start(self):
+        if self.replicas and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def close(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def status(self) -> list[dict]:
+        return [
+            {"replica": r.name, "healthy": r.healthy, "lag_seconds": r.lag_seconds, "error": r.error}
+            for r in self.replicas
+        ]
+
+
+replica_router = ReplicaRouter(REPLICA_URIS)
+
+
+async def get_read_db(user_key: Optional[tuple] = None, organization_id: Optional[int] = None):
+    """Like get_db on the default shard, but on a replica when one is usable for this user."""
+    async with replica_router.session(user_key, organization_id) as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
@@ -1,7 +1,9 @@
 import os
+import asyncio
 import bcrypt
 from jose import jwt
 from datetime import datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
 import logging
 
@@ -14,6 +16,15 @@ logger = logging.getLogger(__name__)
 JWT_SECRET = os.getenv("JWT_SECRET", "your_strong_secret_here")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+
+_hash_executor = None
+
+def _get_hash_executor() -> ProcessPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS)
+    return _hash_executor
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
@@ -21,6 +32,22 @@ def hash_password(password: str) -> str:
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
+def hash_passwords(passwords: list) -> list:
+    """Hash each password; empty entries stay None (invite-only accounts)."""
+    return [hash_password(password) if password else None for password in passwords]
+
+async def hash_passwords_parallel(passwords: list) -> list:
+    """Hash many passwords in the process pool, one chunk per worker."""
+    if not passwords:
+        return []
+    loop = asyncio.get_running_loop()
+    size = -(-len(passwords) // PASSWORD_HASH_WORKERS)
+    chunks = await asyncio.gather(*(
+        loop.run_in_executor(_get_hash_executor(), hash_passwords, passwords[i:i + size])
+        for i in range(0, len(passwords), size)
+    ))
+    return [hashed for chunk in chunks for hashed in chunk]
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hashed password."""
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
@@ -0,0 +1,48 @@
+import json
+import logging
+import threading
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+logger = logging.getLogger(__name__)
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Appends finished spans to a file as JSON lines, one span per line, using
+    OTLP field names. Meant for local testing in place of a collector.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans) -> SpanExportResult:
+        lines = [json.dumps(self._to_dict(span), default=str) for span in spans]
+        try:
+            with self._lock, open(self.path, "a") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            logger.error(f"Error writing spans to {self.path}: {e}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    @staticmethod
+    def _to_dict(span) -> dict:
+        context = span.get_span_context()
+        return {
+            "traceId": format(context.trace_id, "032x"),
+            "spanId": format(context.span_id, "016x"),
+            "parentSpanId": format(span.parent.span_id, "016x") if span.parent else None,
+            "name": span.name,
+            "kind": span.kind.name,
+            "startTimeUnixNano": span.start_time,
+            "endTimeUnixNano": span.end_time,
+            "durationMs": round((span.end_time - span.start_time) / 1e6, 3),
+            "attributes": dict(span.attributes),
+            "status": span.status.status_code.name,
+            "events": [{"name": e.name, "attributes": dict(e.attributes)} for e in span.events],
+            "resource": dict(span.resource.attributes),
+        }
+
+    def shutdown(self):
+        pass
@@ -0,0 +1,63 @@
+import os
+import logging
+from opentelemetry import trace
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+# "file" writes JSON lines to TRACING_FILE_PATH; "otlp" needs opentelemetry-exporter-otlp-proto-http
+# and reads the standard OTEL_EXPORTER_OTLP_* variables
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "file")
+TRACING_FILE_PATH = os.getenv("TRACING_FILE_PATH", "traces.jsonl")
+TRACING_SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "scheduler-api")
+# Share of new traces to record; traces started upstream follow the caller's decision
+TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))
+
+# Spans made before configure_tracing() runs, or with tracing disabled, are no-ops
+tracer = trace.get_tracer("scheduler_api")
+
+
+# The SDK is only imported when tracing is enabled; the API alone is enough for no-op spans
+def _build_exporter():
+    if TRACING_EXPORTER == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            return OTLPSpanExporter()
+        except ImportError:
+            logger.error("TRACING_EXPORTER=otlp needs opentelemetry-exporter-otlp-proto-http; writing spans to a file")
+    from core.trace_export import FileSpanExporter
+    return FileSpanExporter(TRACING_FILE_PATH)
+
+
+def configure_tracing():
+    """
+    Install the SDK tracer provider. Spans are handed to a BatchSpanProcessor,
+    which exports from a background thread; its queue and batch sizes follow
+    the standard OTEL_BSP_* variables.
+    """
+    if not TRACING_ENABLED:
+        return
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": TRACING_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(TRACING_SAMPLE_RATIO))
+    )
+    provider.add_span_processor(BatchSpanProcessor(_build_exporter()))
+    trace.set_tracer_provider(provider)
+    logger.info(f"Tracing enabled, exporting to {TRACING_EXPORTER}")
+
+
+def shutdown_tracing():
+    """Flush spans still queued in the batch processor."""
+    provider = trace.get_tracer_provider()
+    # The API's default provider has no shutdown
+    if hasattr(provider, "shutdown"):
+        provider.shutdown()
@@ -1,28 +1,43 @@
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, update, delete, insert, and_, or_, func, tuple_
 from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import websearch_to_tsquery
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
-from models import Meeting, User
-from schemas import MeetingCreate, MeetingUpdate
-from services.conflict_checker import has_time_conflict
+from models import Meeting, MeetingChange, MeetingChangeLogState, User, meeting_attendees
+from models.meeting import SEARCH_CONFIG
+from schemas import MeetingCreate, MeetingUpdate, MeetingBulkCancel
+from services.conflict_checker import (
+    attendee_join, has_time_conflict, get_busy_intervals, get_conflict_report, lock_attendees, SchedulingConflict
+)
+from services.change_events import record_meeting_changes, meeting_stub
+from crud.user import get_users_by_emails, get_user_by_email
 from utils.time_utils import ensure_utc
+from core.tracing import tracer
+from core.database import session_organization_id
+import base64
 import logging
 
 logger = logging.getLogger(__name__)
 
-async def create_meeting(db, meeting: MeetingCreate, organizer_id: int):
+async def create_meeting(db, meeting: MeetingCreate, organizer_id: int, alternatives: int = 3):
     # Convert to UTC for storage
     start_utc = ensure_utc(meeting.start_time)
     end_utc = ensure_utc(meeting.end_time)
     
     # Get attendee objects
-    stmt = select(User).where(User.email.in_(meeting.attendee_emails))
-    result = await db.execute(stmt)
-    attendees = result.scalars().all()
+    with tracer.start_as_current_span("meeting.resolve_attendees"):
+        stmt = select(User).where(User.email.in_(meeting.attendee_emails))
+        result = await db.execute(stmt)
+        attendees = result.scalars().all()
     
-    # Check for conflicts
-    if await has_time_conflict(db, start_utc, end_utc, [u.id for u in attendees] + [organizer_id]):
-        raise ValueError("Scheduling conflict detected")
+    # Serialize with other bookings for the same people until commit, then check for
+    # conflicts; only build the full report once one is found
+    user_ids = [u.id for u in attendees] + [organizer_id]
+    with tracer.start_as_current_span("meeting.lock_attendees"):
+        await lock_attendees(db, user_ids)
+    if await has_time_conflict(db, start_utc, end_utc, user_ids):
+        report = await get_conflict_report(db, start_utc, end_utc, user_ids, alternatives=alternatives)
+        raise SchedulingConflict(report)
     
     # Create meeting
     db_meeting = Meeting(
@@ -31,32 +46,154 @@ async def create_meeting(db, meeting: MeetingCreate, organizer_id: int):
         start_time=start_utc,
         end_time=end_utc,
         location=meeting.location,
+        organization_id=session_organization_id(db),
         organizer_id=organizer_id
     )
     db_meeting.attendees = attendees
     
-    db.add(db_meeting)
-    await db.commit()
-    await db.refresh(db_meeting)
-    # Eagerly load relationships for async serialization
+    with tracer.start_as_current_span("meeting.insert"):
+        db.add(db_meeting)
+        await db.flush()
+        await record_meeting_changes(db, [("created", meeting_stub(db_meeting), user_ids)])
+        await db.commit()
+    with tracer.start_as_current_span("meeting.reload"):
+        await db.refresh(db_meeting)
+        # Eagerly load relationships for async serialization
+        stmt = (
+            select(Meeting)
+            .options(selectinload(Meeting.attendees), selectinload(Meeting.organizer))
+            .where(Meeting.id == db_meeting.id)
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one()
+
+def _build_meeting(db, meeting: MeetingCreate, organizer_id: int, users_by_email: dict) -> Meeting:
+    return Meeting(
+        title=meeting.title,
+        description=meeting.description,
+        start_time=ensure_utc(meeting.start_time),
+        end_time=ensure_utc(meeting.end_time),
+        location=meeting.location,
+        organization_id=session_organization_id(db),
+        organizer_id=organizer_id,
+        attendees=[users_by_email[e] for e in dict.fromkeys(meeting.attendee_emails) if e in users_by_email]
+    )
+
+async def _load_with_relationships(db, meeting_ids: list[int]):
     stmt = (
         select(Meeting)
         .options(selectinload(Meeting.attendees), selectinload(Meeting.organizer))
-        .where(Meeting.id == db_meeting.id)
+        .where(Meeting.id.in_(meeting_ids))
+        .order_by(Meeting.start_time)
     )
     result = await db.execute(stmt)
-    return result.scalar_one()
+    return result.scalars().all()
+
+async def create_meetings_bulk(db, meetings: list[MeetingCreate], organizer_id: int):
+    """
+    Create several meetings in one transaction; nothing is stored if any of
+    them conflicts with existing meetings or with another one in the batch.
+    Overlap is closed-interval, as in has_time_conflict.
+    """
+    users = await get_users_by_emails(db, [email for m in meetings for email in m.attendee_emails])
+    users_by_email = {u.email: u for u in users}
+    db_meetings = [_build_meeting(db, m, organizer_id, users_by_email) for m in meetings]
+
+    # Lock everyone involved, then re-check against the current calendars in a single query
+    await lock_attendees(db, [u.id for u in users] + [organizer_id])
+    busy = await get_busy_intervals(
+        db,
+        [u.id for u in users] + [organizer_id],
+        min(m.start_time for m in db_meetings),
+        max(m.end_time for m in db_meetings)
+    )
+    for db_meeting in db_meetings:
+        start, end = db_meeting.start_time, db_meeting.end_time
+        for user_id in {u.id for u in db_meeting.attendees} | {organizer_id}:
+            intervals = busy.setdefault(user_id, [])
+            if any(s <= end and e >= start for s, e in intervals):
+                raise ValueError("Scheduling conflict detected")
+            # Later meetings in the batch must not overlap this one either
+            intervals.append((start, end))
+
+    db.add_all(db_meetings)
+    await db.flush()
+    await record_meeting_changes(db, [
+        ("created", meeting_stub(m), [u.id for u in m.attendees] + [organizer_id]) for m in db_meetings
+    ])
+    await db.commit()
+    return await _load_with_relationships(db, [m.id for m in db_meetings])
+
+async def create_meetings_group(db, bookings: list[tuple[MeetingCreate, int]], alternatives: int = 3) -> list:
+    """
+    Book independent (meeting, organizer_id) requests in a single transaction.
+
+    Conflicts for the whole group are checked set-based against one busy
+    query, in submission order, so each booking gets the outcome it would
+    have had running alone through create_meeting. Returns one entry per
+    booking: the created Meeting, or the SchedulingConflict it hit.
+    """
+    users = await get_users_by_emails(db, [email for m, _ in bookings for email in m.attendee_emails])
+    users_by_email = {u.email: u for u in users}
+    prepared = []
+    for meeting, organizer_id in bookings:
+        db_meeting = _build_meeting(db, meeting, organizer_id, users_by_email)
+        prepared.append((db_meeting, [u.id for u in db_meeting.attendees] + [organizer_id]))
+
+    user_ids = {user_id for _, check_ids in prepared for user_id in check_ids}
+    await lock_attendees(db, user_ids)
+    busy = await get_busy_intervals(
+        db,
+        list(user_ids),
+        min(m.start_time for m, _ in prepared),
+        max(m.end_time for m, _ in prepared)
+    )
+
+    outcomes = [None] * len(prepared)
+    for i, (db_meeting, check_ids) in enumerate(prepared):
+        # Closed-interval overlap, the same rule has_time_conflict applies
+        if any(
+            s <= db_meeting.end_time and e >= db_meeting.start_time
+            for user_id in check_ids for s, e in busy.get(user_id, [])
+        ):
+            continue
+        for attendee in db_meeting.attendees:
+            busy.setdefault(attendee.id, []).append((db_meeting.start_time, db_meeting.end_time))
+        db.add(db_meeting)
+        outcomes[i] = db_meeting
+    await db.flush()
+
+    for i, (db_meeting, check_ids) in enumerate(prepared):
+        if outcomes[i] is None:
+            report = await get_conflict_report(
+                db, db_meeting.start_time, db_meeting.end_time, check_ids, alternatives=alternatives
+            )
+            outcomes[i] = SchedulingConflict(report)
+
+    await record_meeting_changes(db, [
+        ("created", meeting_stub(db_meeting), check_ids)
+        for (db_meeting, check_ids), outcome in zip(prepared, outcomes)
+        if outcome is db_meeting
+    ])
+    await db.commit()
+    created = await _load_with_relationships(db, [m.id for m in outcomes if isinstance(m, Meeting)])
+    by_id = {m.id: m for m in created}
+    return [by_id[m.id] if isinstance(m, Meeting) else m for m in outcomes]
 
 async def get_user_meetings(db, user_id: int, start: datetime, end: datetime):
     stmt = (
         select(Meeting)
         .options(selectinload(Meeting.attendees), selectinload(Meeting.organizer))
-        .join(Meeting.attendees)
+        .join(meeting_attendees, attendee_join)
         .where(
             and_(
-                User.id == user_id,
+                meeting_attendees.c.user_id == user_id,
                 Meeting.start_time >= ensure_utc(start),
-                Meeting.end_time <= ensure_utc(end)
+                Meeting.end_time <= ensure_utc(end),
+                # Redundant bounds on the partition keys so Postgres can prune partitions
+                Meeting.start_time <= ensure_utc(end),
+                meeting_attendees.c.meeting_start_time >= ensure_utc(start),
+                meeting_attendees.c.meeting_start_time <= ensure_utc(end)
             )
         )
         .order_by(Meeting.start_time)
@@ -69,12 +206,16 @@ async def get_user_meetings_in_range(db: AsyncSession, user_id: int, start: date
     stmt = (
         select(Meeting)
         .options(selectinload(Meeting.attendees), selectinload(Meeting.organizer))
-        .join(Meeting.attendees)
+        .join(meeting_attendees, attendee_join)
         .where(
             and_(
-                User.id == user_id,
+                meeting_attendees.c.user_id == user_id,
                 Meeting.start_time >= ensure_utc(start),
-                Meeting.end_time <= ensure_utc(end)
+                Meeting.end_time <= ensure_utc(end),
+                # Redundant bounds on the partition keys so Postgres can prune partitions
+                Meeting.start_time <= ensure_utc(end),
+                meeting_attendees.c.meeting_start_time >= ensure_utc(start),
+                meeting_attendees.c.meeting_start_time <= ensure_utc(end)
             )
         )
         .order_by(Meeting.start_time)
@@ -82,33 +223,381 @@ async def get_user_meetings_in_range(db: AsyncSession, user_id: int, start: date
     result = await db.execute(stmt)
     return result.scalars().all()
 
-async def update_meeting(db, meeting_id: int, meeting_update: MeetingUpdate):
-    stmt = select(Meeting).where(Meeting.id == meeting_id).options(selectinload(Meeting.attendees))
+async def get_user_meeting_summary(db, user_id: int, start: datetime, end: datetime, tz: str = "UTC"):
+    """
+    Per-day meeting counts and compact stubs for meetings starting in [start, end),
+    computed in SQL without loading attendees. Days are calendar dates in ``tz``.
+
+    Returns ``(days, stubs)`` where days are ``(date, count)`` rows.
+    """
+    start_utc = ensure_utc(start)
+    end_utc = ensure_utc(end)
+    conditions = and_(
+        meeting_attendees.c.user_id == user_id,
+        Meeting.start_time >= start_utc,
+        Meeting.start_time < end_utc,
+        meeting_attendees.c.meeting_start_time >= start_utc,
+        meeting_attendees.c.meeting_start_time < end_utc
+    )
+    day = func.date(func.timezone(tz, Meeting.start_time)).label("date")
+    days_stmt = (
+        select(day, func.count().label("count"))
+        .select_from(Meeting)
+        .join(meeting_attendees, attendee_join)
+        .where(conditions)
+        .group_by(day)
+        .order_by(day)
+    )
+    stubs_stmt = (
+        select(Meeting.id, Meeting.title, Meeting.start_time, Meeting.end_time)
+        .join(meeting_attendees, attendee_join)
+        .where(conditions)
+        .order_by(Meeting.start_time, Meeting.id)
+    )
+    days = (await db.execute(days_stmt)).all()
+    stubs = (await db.execute(stubs_stmt)).mappings().all()
+    return days, stubs
+
+def _encode_search_cursor(rank: float, meeting_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{rank!r}:{meeting_id}".encode()).decode()
+
+def _decode_search_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        rank, meeting_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        return float(rank), int(meeting_id)
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid search cursor")
+
+async def search_user_meetings(db, user_id: int, q: str, limit: int = 20, cursor: str = None):
+    """
+    The user's meetings matching a web-style search (``"quoted phrases"``,
+    ``or``, ``-excluded``) over title, description and location, best match
+    first. The GIN index on the generated search_vector finds matches and the
+    attendee join restricts them to the user; only those rows are ranked.
+
+    Pages are keyset-paginated on (rank, id), so later pages cost the same
+    as the first. Returns ``(hits, next cursor or None)``; raises ValueError
+    for a malformed cursor.
+    """
+    query = websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank(Meeting.search_vector, query)
+    conditions = [
+        meeting_attendees.c.user_id == user_id,
+        Meeting.search_vector.bool_op("@@")(query)
+    ]
+    if cursor:
+        after_rank, after_id = _decode_search_cursor(cursor)
+        conditions.append(tuple_(rank, Meeting.id) < tuple_(after_rank, after_id))
+
+    stmt = (
+        select(
+            Meeting.id, Meeting.title, Meeting.description, Meeting.location,
+            Meeting.start_time, Meeting.end_time, rank.label("rank")
+        )
+        .join(meeting_attendees, attendee_join)
+        .where(and_(*conditions))
+        .order_by(rank.desc(), Meeting.id.desc())
+        .limit(limit + 1)
+    )
     result = await db.execute(stmt)
-    db_meeting = result.scalar_one_or_none()
-    if not db_meeting:
+    hits = result.mappings().all()
+    if len(hits) <= limit:
+        return hits, None
+    last = hits[limit - 1]
+    return hits[:limit], _encode_search_cursor(last["rank"], last["id"])
+
+async def get_user_meeting(db, meeting_id: int, user_id: int):
+    """A single meeting with relationships, if the user organizes or attends it."""
+    stmt = (
+        select(Meeting)
+        .options(selectinload(Meeting.attendees), selectinload(Meeting.organizer))
+        .outerjoin(meeting_attendees, and_(attendee_join, meeting_attendees.c.user_id == user_id))
+        .where(
+            and_(
+                Meeting.id == meeting_id,
+                or_(Meeting.organizer_id == user_id, meeting_attendees.c.user_id.is_not(None))
+            )
+        )
+        .limit(1)
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+async def update_meeting(db, meeting_id: int, meeting_update: MeetingUpdate, alternatives: int = 3):
+    """
+    Apply a partial update: one UPDATE ... RETURNING for the scalar fields and
+    a set diff on meeting_attendees instead of replacing the whole list.
+
+    Conflicts are re-checked only where the change can create new overlaps:
+    all attendees when the meeting grows or moves outside its old interval,
+    otherwise just the attendees being added.
+    """
+    stmt = (
+        select(Meeting.start_time, Meeting.end_time, Meeting.organizer_id, meeting_attendees.c.user_id)
+        .outerjoin(meeting_attendees, attendee_join)
+        .where(Meeting.id == meeting_id)
+        .with_for_update(of=Meeting)
+    )
+    result = await db.execute(stmt)
+    rows = result.all()
+    if not rows:
         return None
-    # Update fields if provided
-    for field in ["title", "description", "start_time", "end_time", "location"]:
-        value = getattr(meeting_update, field, None)
-        if value is not None:
-            setattr(db_meeting, field, value)
-    # Update attendees if provided
+    old_start, old_end = ensure_utc(rows[0].start_time), ensure_utc(rows[0].end_time)
+    organizer_id = rows[0].organizer_id
+    current_ids = {row.user_id for row in rows if row.user_id is not None}
+
+    # Scalar fields, with times normalized the same way create_meeting does
+    values = {
+        field: getattr(meeting_update, field)
+        for field in ["title", "description", "location"]
+        if getattr(meeting_update, field) is not None
+    }
+    start_utc = ensure_utc(meeting_update.start_time) if meeting_update.start_time is not None else old_start
+    end_utc = ensure_utc(meeting_update.end_time) if meeting_update.end_time is not None else old_end
+    if end_utc <= start_utc:
+        raise ValueError("End time must be after start time")
+    if start_utc != old_start:
+        values["start_time"] = start_utc
+    if end_utc != old_end:
+        values["end_time"] = end_utc
+
+    new_ids = current_ids
     if meeting_update.attendee_emails is not None:
-        stmt = select(User).where(User.email.in_(meeting_update.attendee_emails))
-        result = await db.execute(stmt)
-        attendees = result.scalars().all()
-        db_meeting.attendees = attendees
+        new_ids = {u.id for u in await get_users_by_emails(db, meeting_update.attendee_emails)}
+    added = new_ids - current_ids
+    removed = current_ids - new_ids
+
+    if start_utc < old_start or end_utc > old_end:
+        check_ids = new_ids | {organizer_id}
+    else:
+        check_ids = added
+    if check_ids:
+        await lock_attendees(db, check_ids)
+        if await has_time_conflict(db, start_utc, end_utc, list(check_ids), exclude_meeting_id=meeting_id):
+            report = await get_conflict_report(
+                db, start_utc, end_utc, list(check_ids),
+                exclude_meeting_id=meeting_id, alternatives=alternatives
+            )
+            raise SchedulingConflict(report)
+
+    if removed:
+        await db.execute(
+            delete(meeting_attendees).where(
+                and_(
+                    meeting_attendees.c.meeting_id == meeting_id,
+                    meeting_attendees.c.user_id.in_(removed)
+                )
+            )
+        )
+    if added:
+        await db.execute(
+            insert(meeting_attendees),
+            # Rows take the current start; the UPDATE below cascades any new one
+            [
+                {"meeting_id": meeting_id, "user_id": user_id, "meeting_start_time": old_start}
+                for user_id in sorted(added)
+            ]
+        )
+
+    stmt = (
+        update(Meeting)
+        .where(Meeting.id == meeting_id)
+        .values(updated_at=func.now(), **values)
+        .returning(Meeting)
+        .options(selectinload(Meeting.attendees), selectinload(Meeting.organizer))
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    db_meeting = result.scalar_one()
+    # Attendees who were dropped see the meeting disappear from their calendar
+    stub = meeting_stub(db_meeting)
+    await record_meeting_changes(db, [
+        ("updated", stub, new_ids | {organizer_id}),
+        ("deleted", stub, removed - {organizer_id})
+    ])
     await db.commit()
-    await db.refresh(db_meeting)
     return db_meeting
 
 async def delete_meeting(db, meeting_id: int):
-    stmt = select(Meeting).where(Meeting.id == meeting_id)
+    stmt = select(Meeting).where(Meeting.id == meeting_id).options(selectinload(Meeting.attendees))
     result = await db.execute(stmt)
     db_meeting = result.scalar_one_or_none()
     if not db_meeting:
         return False
+    user_ids = [u.id for u in db_meeting.attendees] + [db_meeting.organizer_id]
+    await record_meeting_changes(db, [("deleted", meeting_stub(db_meeting), user_ids)])
     await db.delete(db_meeting)
     await db.commit()
-    return True
\ No newline at end of file
+    return True
+
+class BulkCancelInterrupted(Exception):
+    """A bulk cancel failed after some batches were committed; carries what was deleted."""
+
+    def __init__(self, deleted: list[dict], by_user: dict):
+        super().__init__(f"Bulk cancel stopped after deleting {len(deleted)} meetings")
+        self.deleted = deleted
+        self.by_user = by_user
+
+async def delete_meetings(db, filters: MeetingBulkCancel, organizer_id: int):
+    """
+    Delete every meeting organized by ``organizer_id`` that matches the
+    filters, in batches of ``filters.batch_size``.
+
+    Each batch locks its meetings, removes their meeting_attendees rows and
+    then the meetings themselves with DELETE ... RETURNING, and commits.
+    Returns the deleted meetings and, per affected user (attendees and
+    organizers), the meetings they lost. If a batch fails after earlier
+    ones committed, raises BulkCancelInterrupted with those results.
+    """
+    conditions = [Meeting.organizer_id == organizer_id]
+    if filters.ids:
+        conditions.append(Meeting.id.in_(filters.ids))
+    if filters.organizer_email:
+        organizer = await get_user_by_email(db, filters.organizer_email)
+        if not organizer:
+            return [], {}
+        conditions.append(Meeting.organizer_id == organizer.id)
+    if filters.attendee_email:
+        attendee = await get_user_by_email(db, filters.attendee_email)
+        if not attendee:
+            return [], {}
+        conditions.append(Meeting.id.in_(
+            select(meeting_attendees.c.meeting_id).where(meeting_attendees.c.user_id == attendee.id)
+        ))
+    if filters.start:
+        conditions.append(Meeting.start_time >= ensure_utc(filters.start))
+    if filters.end:
+        conditions.append(Meeting.end_time <= ensure_utc(filters.end))
+        conditions.append(Meeting.start_time <= ensure_utc(filters.end))
+
+    deleted = []
+    by_user = {}
+    try:
+        await _delete_meeting_batches(db, conditions, filters.batch_size, deleted, by_user)
+    except Exception as e:
+        await db.rollback()
+        if deleted:
+            raise BulkCancelInterrupted(deleted, by_user) from e
+        raise
+    return deleted, by_user
+
+async def _delete_meeting_batches(db, conditions, batch_size: int, deleted: list, by_user: dict):
+    """Delete matching meetings batch by batch, appending committed results to ``deleted`` and ``by_user``."""
+    while True:
+        stmt = (
+            select(Meeting.id)
+            .where(and_(*conditions))
+            .order_by(Meeting.id)
+            .limit(batch_size)
+            .with_for_update()
+        )
+        result = await db.execute(stmt)
+        ids = result.scalars().all()
+        if not ids:
+            break
+
+        stmt = (
+            delete(meeting_attendees)
+            .where(meeting_attendees.c.meeting_id.in_(ids))
+            .returning(meeting_attendees.c.meeting_id, meeting_attendees.c.user_id)
+        )
+        result = await db.execute(stmt)
+        attendee_rows = result.all()
+
+        stmt = (
+            delete(Meeting)
+            .where(Meeting.id.in_(ids))
+            .returning(Meeting.id, Meeting.title, Meeting.start_time, Meeting.end_time, Meeting.organizer_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        meetings = {row.id: dict(row._mapping) for row in result.all()}
+
+        affected = [(m["organizer_id"], m["id"]) for m in meetings.values()]
+        affected += [(row.user_id, row.meeting_id) for row in attendee_rows]
+        users_by_meeting = {}
+        for user_id, meeting_id in set(affected):
+            users_by_meeting.setdefault(meeting_id, []).append(user_id)
+        await record_meeting_changes(db, [
+            ("deleted", meeting_stub(m), users_by_meeting[m["id"]]) for m in meetings.values()
+        ])
+        await db.commit()
+        # Only committed batches are reported
+        deleted.extend(meetings.values())
+        for meeting_id, user_ids in users_by_meeting.items():
+            for user_id in user_ids:
+                by_user.setdefault(user_id, []).append(meetings[meeting_id])
+
+        if len(ids) < batch_size:
+            break
+
+async def get_meeting_changes(db, user_id: int, since: int, limit: int = 500):
+    """
+    Changes to the user's calendar after version ``since``, collapsed to the
+    latest change per meeting, with full details for upserts.
+
+    Only versions below meeting_change_horizon() are served: every
+    transaction below it has finished, so no change can later commit behind
+    a version handed out here. Pages end on a transaction boundary for the
+    same reason. ``since=0`` starts a full sync: no changes, just the current
+    version, to be fetched before loading the calendar itself.
+
+    Returns ``(entries, version, has_more)``, or None when ``since`` predates
+    the retained change log and the client must do a full sync.
+    """
+    purged_through, horizon = (await db.execute(
+        select(MeetingChangeLogState.purged_through, func.meeting_change_horizon())
+    )).one()
+    if since == 0:
+        return [], horizon - 1, False
+    if since < purged_through:
+        return None
+
+    conditions = [
+        MeetingChange.user_id == user_id,
+        MeetingChange.version > since,
+        MeetingChange.version < horizon
+    ]
+    stmt = (
+        select(MeetingChange.version, MeetingChange.meeting_id, MeetingChange.op)
+        .where(and_(*conditions))
+        .order_by(MeetingChange.version, MeetingChange.id)
+        .limit(limit + 1)
+    )
+    rows = (await db.execute(stmt)).all()
+    has_more = len(rows) > limit
+    if has_more:
+        # Drop the transaction the page cut through; it starts the next page
+        cut = rows[limit].version
+        rows = [row for row in rows if row.version < cut]
+        if not rows:
+            # A single transaction larger than the page is returned whole
+            stmt = (
+                select(MeetingChange.version, MeetingChange.meeting_id, MeetingChange.op)
+                .where(and_(MeetingChange.user_id == user_id, MeetingChange.version == cut))
+                .order_by(MeetingChange.id)
+            )
+            rows = (await db.execute(stmt)).all()
+        version = rows[-1].version
+    else:
+        # Everything below the horizon has been seen
+        version = max(since, horizon - 1)
+
+    # Rows are in version order, so the last one per meeting is its latest change
+    latest = {row.meeting_id: row for row in rows}
+    upsert_ids = [row.meeting_id for row in latest.values() if row.op == "upsert"]
+    meetings = {m.id: m for m in await _load_with_relationships(db, upsert_ids)} if upsert_ids else {}
+
+    entries = []
+    for row in latest.values():
+        meeting = meetings.get(row.meeting_id)
+        # A meeting missing here was deleted after this page; report it as gone
+        entries.append({
+            "version": row.version,
+            "op": "upsert" if meeting is not None else "delete",
+            "meeting_id": row.meeting_id,
+            "meeting": meeting
+        })
+    entries.sort(key=lambda entry: entry["version"])
+    return entries, version, has_more
+
@@ -0,0 +1,80 @@
+from typing import Optional
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import Organization, User
+from models.organization import DEFAULT_SHARD
+from core.database import shard_router
+from schemas import UserCreate
+
+async def get_organization_by_slug(db: AsyncSession, slug: str):
+    stmt = select(Organization).where(Organization.slug == slug)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+async def get_organization(db: AsyncSession, organization_id: int):
+    stmt = select(Organization).where(Organization.id == organization_id)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+async def least_loaded_shard(db: AsyncSession) -> str:
+    """Configured shard holding the fewest organizations."""
+    stmt = select(Organization.shard, func.count()).group_by(Organization.shard)
+    counts = dict((await db.execute(stmt)).all())
+    return min(shard_router.shards, key=lambda shard: counts.get(shard, 0))
+
+async def _has_users(organization: Organization) -> bool:
+    async with shard_router.session(organization.shard, organization.id) as shard_db:
+        result = await shard_db.execute(select(User.id).limit(1))
+        return result.first() is not None
+
+async def create_organization(db: AsyncSession, name: str, slug: str, owner: UserCreate,
+                              shard: Optional[str] = None):
+    """
+    Register an organization in the directory (``db`` must be on the default
+    shard), place it on ``shard`` or the least loaded one, and create its
+    owner there. Other shards get a copy of the row so their users and
+    meetings can reference it; the copy and the owner commit together.
+
+    Safe to retry: a directory entry whose owner was never stored is taken
+    over by the next attempt at the slug instead of blocking it.
+    """
+    organization = await get_organization_by_slug(db, slug)
+    if organization is None:
+        organization = Organization(name=name, slug=slug, shard=shard or await least_loaded_shard(db))
+        db.add(organization)
+        try:
+            await db.flush()
+        except IntegrityError:
+            await db.rollback()
+            raise ValueError("Organization slug already taken")
+    elif await _has_users(organization):
+        raise ValueError("Organization slug already taken")
+    else:
+        organization.name = name
+
+    # ``db`` is scoped to the caller's organization, so the owner's is set explicitly
+    owner_user = User(
+        email=owner.email,
+        full_name=owner.full_name,
+        hashed_password=owner.password,  # Already hashed
+        organization_id=organization.id
+    )
+    if organization.shard == DEFAULT_SHARD:
+        db.add(owner_user)
+        await db.commit()
+    else:
+        # Reserve the slug first; if the shard write fails the next attempt resumes here
+        await db.commit()
+        async with shard_router.session(organization.shard, organization.id) as shard_db:
+            await shard_db.execute(
+                insert(Organization)
+                .values(id=organization.id, name=organization.name, slug=slug, shard=organization.shard)
+                .on_conflict_do_update(index_elements=[Organization.id], set_={"name": organization.name})
+            )
+            shard_db.add(owner_user)
+            await shard_db.commit()
+    await db.refresh(organization)
+    shard_router.remember(organization.id, organization.shard)
+    return organization
@@ -1,18 +1,99 @@
-from sqlalchemy import select
+from sqlalchemy import select, and_, or_, func
+from sqlalchemy.dialects.postgresql import insert
 from models import User
 from schemas import UserCreate
 from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import session_organization_id
 
 async def get_user_by_email(db: AsyncSession, email: str):
     stmt = select(User).where(User.email == email)
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
+async def get_users_by_emails(db: AsyncSession, emails):
+    stmt = select(User).where(User.email.in_(set(emails)))
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+async def get_existing_emails(db: AsyncSession, emails) -> set[str]:
+    stmt = select(User.email).where(User.email.in_(set(emails)))
+    result = await db.execute(stmt)
+    return set(result.scalars().all())
+
+async def insert_users_ignoring_existing(db: AsyncSession, rows: list[dict]) -> dict[str, int]:
+    """
+    Insert users in one statement, skipping emails that already exist in the
+    session's organization. Returns email -> id for the rows actually
+    inserted; the caller commits.
+    """
+    if not rows:
+        return {}
+    organization_id = session_organization_id(db)
+    stmt = (
+        insert(User)
+        .values([{**row, "organization_id": organization_id} for row in rows])
+        .on_conflict_do_nothing(index_elements=[User.organization_id, User.email])
+        .returning(User.id, User.email)
+    )
+    result = await db.execute(stmt)
+    return {row.email: row.id for row in result}
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+async def search_users_by_prefix(db: AsyncSession, q: str, limit: int):
+    """
+    Active users whose email or full name starts with ``q`` (lowercased).
+    Served by the text_pattern_ops indexes on lower(email) and lower(full_name).
+    """
+    pattern = _like_escape(q) + "%"
+    stmt = (
+        select(User)
+        .where(
+            and_(
+                User.is_active.is_(True),
+                or_(
+                    func.lower(User.email).like(pattern, escape="\\"),
+                    func.lower(User.full_name).like(pattern, escape="\\")
+                )
+            )
+        )
+        .order_by(User.email)
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+async def search_users_by_substring(db: AsyncSession, q: str, limit: int, exclude_ids=()):
+    """
+    Active users whose email or full name contains ``q`` (lowercased), best
+    trigram similarity first. Served by the pg_trgm GIN indexes; ``q`` should
+    be at least three characters so it yields a trigram.
+    """
+    pattern = "%" + _like_escape(q) + "%"
+    email = func.lower(User.email)
+    full_name = func.lower(User.full_name)
+    conditions = [
+        User.is_active.is_(True),
+        or_(email.like(pattern, escape="\\"), full_name.like(pattern, escape="\\"))
+    ]
+    if exclude_ids:
+        conditions.append(User.id.not_in(exclude_ids))
+    stmt = (
+        select(User)
+        .where(and_(*conditions))
+        .order_by(func.greatest(func.similarity(email, q), func.similarity(full_name, q)).desc(), User.email)
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
 async def create_user(db: AsyncSession, user: UserCreate):
     db_user = User(
         email=user.email,
         full_name=user.full_name,
-        hashed_password=user.password  # Already hashed
+        hashed_password=user.password,  # Already hashed
+        organization_id=session_organization_id(db)
     )
     db.add(db_user)
     await db.commit()
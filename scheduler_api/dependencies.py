@@ -1,10 +1,53 @@
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException, Request
-from core.database import get_db as get_db_session
+from core.database import get_db as get_db_session, shard_router
+from core.replicas import get_read_db, replica_router
+from core.tracing import tracer
+from models.organization import DEFAULT_ORGANIZATION_ID, DEFAULT_SHARD
 
-async def get_db() -> AsyncSession:
-    async for session in get_db_session():
+READ_METHODS = {"GET", "HEAD"}
+
+def request_organization_id(request: Request) -> int:
+    """Organization named in the caller's token; unauthenticated requests use the default one."""
+    return getattr(request.state, "organization_id", DEFAULT_ORGANIZATION_ID)
+
+def request_user_key(request: Request) -> Optional[tuple]:
+    """
+    (organization id, user id) of the caller for per-user state such as replica
+    stickiness and rate limits; emails are only unique within an organization.
+    Tokens issued before they carried the user id fall back to the email.
+    """
+    user_email = getattr(request.state, "user_email", None)
+    if user_email is None:
+        return None
+    return request_organization_id(request), getattr(request.state, "user_id", None) or user_email
+
+async def get_db(request: Request = None) -> AsyncSession:
+    """
+    Session for the request, on the organization's shard and scoped to its
+    rows. GET and HEAD requests on the default shard read from a replica when
+    one is configured and healthy, everything else uses the primary. Writes
+    keep the caller's reads on the primary for REPLICA_STICKY_SECONDS.
+    """
+    if request is None:
+        async for session in get_db_session():
+            yield session
+        return
+
+    organization_id = request_organization_id(request)
+    shard = await shard_router.shard_for(organization_id)
+    user_key = request_user_key(request)
+    if request.method in READ_METHODS and shard == DEFAULT_SHARD:
+        async for session in get_read_db(user_key, organization_id):
+            yield session
+        return
+
+    replica_router.note_write(user_key)
+    async for session in get_db_session(shard, organization_id):
         yield session
+    # Again once committed, so the window is measured from the write
+    replica_router.note_write(user_key)
 
 async def get_current_user(
     request: Request,
@@ -15,7 +58,8 @@ async def get_current_user(
         return None
     
     from crud.user import get_user_by_email
-    return await get_user_by_email(db, request.state.user_email)
+    with tracer.start_as_current_span("auth.get_current_user"):
+        return await get_user_by_email(db, request.state.user_email)
 
 async def get_current_active_user(
     current_user: dict = Depends(get_current_user)
@@ -25,4 +69,4 @@ async def get_current_active_user(
         raise HTTPException(status_code=401, detail="Not authenticated")
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
\ No newline at end of file
+    return current_user
@@ -1,10 +1,22 @@
 import os
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from middleware.security_middleware import SecurityMiddleware
-from routers import meetings, availability, auth
-from tasks.background import purge_old_meetings, send_reminders
-from core.database import create_tables
+from middleware.admission_control import AdmissionControlMiddleware
+from middleware.profiling_middleware import ProfilingMiddleware, PROFILING_ENABLED
+from middleware.metrics_middleware import MetricsMiddleware
+from middleware.query_stats_middleware import QueryStatsMiddleware
+from routers import meetings, availability, auth, users, organizations
+from tasks.background import purge_old_meetings, ensure_meeting_partitions, purge_change_log
+from core.database import check_schema_revision, async_engine, shard_router
+from core.metrics import register_collectors
+from core.query_stats import instrument_engine
+from core.tracing import configure_tracing, shutdown_tracing, TRACING_ENABLED
+from core.replicas import replica_router
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from services.booking_coalescer import booking_coalescer
+from services.change_events import change_broadcasters
+from services.single_flight import single_flight_stats, meetings_in_range_flight, time_conflict_flight
 from contextlib import asynccontextmanager
 import logging
 import asyncio
@@ -15,15 +27,46 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# "strict" refuses to start on a database behind this code's migrations, "warn" only logs, "off" skips the check
+SCHEMA_CHECK = os.getenv("SCHEMA_CHECK", "strict")
+
+async def verify_schema():
+    if SCHEMA_CHECK == "off":
+        return
+    # Every shard is migrated separately, so each one is checked
+    for shard, engine in shard_router.engines.items():
+        current, heads, known = await check_schema_revision(engine)
+        if current == heads:
+            continue
+        message = f"Shard {shard} schema at {sorted(current) or 'no revision'}, code expects {sorted(heads)}"
+        # Revisions this code does not know come from a newer release; older workers
+        # keep serving while a rolling deploy replaces them
+        behind = not current or current <= known
+        if SCHEMA_CHECK == "strict" and behind:
+            raise RuntimeError(f"{message}; run `alembic upgrade head` against it")
+        logger.warning(message)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup tasks
     logger.info("Starting background tasks")
-    create_tables()
-    # asyncio.create_task(run_periodic_tasks())
+    await verify_schema()
+    replica_router.start()
+    periodic_tasks = asyncio.create_task(run_periodic_tasks())
     yield
     # Shutdown tasks
     logger.info("Stopping application")
+    periodic_tasks.cancel()
+    try:
+        await periodic_tasks
+    except asyncio.CancelledError:
+        pass
+    await booking_coalescer.close()
+    for change_broadcaster in change_broadcasters.values():
+        await change_broadcaster.close()
+    await replica_router.close()
+    await shard_router.close()
+    shutdown_tracing()
 
 app = FastAPI(
     title="Meeting Scheduler API",
@@ -33,6 +76,13 @@ app = FastAPI(
     redoc_url=None
 )
 
+# Admission control runs inside the security middleware so it sees the user
+app.add_middleware(AdmissionControlMiddleware)
+
+# Opt-in request profiling; inside the security middleware so it knows the user
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
 # Add security middleware
 app.add_middleware(SecurityMiddleware)
 
@@ -45,23 +95,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL count and time, reported in the Server-Timing header
+app.add_middleware(QueryStatsMiddleware)
+for engine in shard_router.engines.values():
+    instrument_engine(engine)
+for replica in replica_router.replicas:
+    instrument_engine(replica.engine)
+
+# Request spans wrap authentication, so the JWT check shows up in traces
+if TRACING_ENABLED:
+    from middleware.tracing_middleware import TracingMiddleware
+    configure_tracing()
+    app.add_middleware(TracingMiddleware)
+
+# Outermost, so rejected and failed requests are measured too
+app.add_middleware(MetricsMiddleware)
+register_collectors(async_engine, [meetings_in_range_flight, time_conflict_flight])
+
 # Include routers
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(meetings.router, prefix="/meetings", tags=["Meetings"])
 app.include_router(availability.router, prefix="/availability", tags=["Availability"])
+app.include_router(users.router, prefix="/users", tags=["Users"])
+app.include_router(organizations.router, prefix="/organizations", tags=["Organizations"])
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return {"status": "healthy", "single_flight": single_flight_stats(), "replicas": replica_router.status()}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 # Background task runner
 async def run_periodic_tasks():
     while True:
         try:
+            # send_reminders is not scheduled: meetings have no reminder_sent column to track it
             await asyncio.gather(
+                ensure_meeting_partitions(),
                 purge_old_meetings(),
-                send_reminders()
+                purge_change_log()
             )
             await asyncio.sleep(300)  # Run every 5 minutes
         except Exception as e:
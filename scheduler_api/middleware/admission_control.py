@@ -0,0 +1,172 @@
+import os
+import math
+import time
+import asyncio
+import logging
+from typing import Callable
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+from core.database import DB_POOL_SIZE, DB_MAX_OVERFLOW
+from dependencies import request_user_key
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Per-user token bucket: sustained requests per second and burst size
+RATE_LIMIT_PER_SECOND = float(os.getenv("RATE_LIMIT_PER_SECOND", "10"))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "20"))
+# Share buckets across nodes when set; falls back to in-process buckets on errors
+RATE_LIMIT_REDIS_URI = os.getenv("RATE_LIMIT_REDIS_URI", "")
+# Requests allowed in flight at once; each may hold a pooled DB connection
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+# How many requests may wait for a slot, and for how long, before being shed
+ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", str(MAX_CONCURRENT_REQUESTS)))
+ADMISSION_QUEUE_TIMEOUT_MS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_MS", "100"))
+
+# Atomic refill-and-take on a hash {tokens, ts}; uses the server clock so nodes agree
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class TokenBucketLimiter:
+    """In-process token buckets keyed by client identity."""
+
+    def __init__(self, rate: float, burst: int, max_keys: int = 100_000):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets = {}
+
+    async def acquire(self, key: str) -> float:
+        """Take a token; returns 0 if allowed, else seconds until one is available."""
+        now = time.monotonic()
+        tokens, last = self._buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+            self._evict(now)
+            return 0
+        self._buckets[key] = (tokens, now)
+        return (1 - tokens) / self.rate
+
+    def _evict(self, now: float):
+        if len(self._buckets) <= self.max_keys:
+            return
+        # Buckets that have refilled completely carry no state worth keeping
+        full_after = self.burst / self.rate
+        self._buckets = {k: v for k, v in self._buckets.items() if now - v[1] < full_after}
+
+
+class RedisTokenBucketLimiter:
+    """Token buckets shared by every node through Redis, with a local fallback."""
+
+    def __init__(self, uri: str, rate: float, burst: int, fallback: TokenBucketLimiter):
+        import redis.asyncio as redis  # optional dependency, only needed when configured
+        self.rate = rate
+        self.burst = burst
+        self.fallback = fallback
+        self._client = redis.from_url(uri)
+        self._script = self._client.register_script(TOKEN_BUCKET_SCRIPT)
+        self._last_warning = 0.0
+
+    async def acquire(self, key: str) -> float:
+        try:
+            allowed, tokens = await self._script(keys=[f"ratelimit:{key}"], args=[self.rate, self.burst])
+        except Exception as e:
+            if time.monotonic() - self._last_warning > 60:
+                self._last_warning = time.monotonic()
+                logger.warning(f"Redis rate limiter unavailable, using local buckets: {e}")
+            return await self.fallback.acquire(key)
+        if int(allowed):
+            return 0
+        return (1 - float(tokens)) / self.rate
+
+
+class AdmissionControlMiddleware(BaseHTTPMiddleware):
+    """
+    Rejects work before it reaches a DB session: 429 when a client exceeds its
+    token bucket, 503 when the global concurrency cap is reached and no slot
+    frees up within the queue timeout. Both carry Retry-After.
+
+    Add it before SecurityMiddleware so it runs inside it and can key buckets
+    by the authenticated user.
+    """
+
+    EXCLUDED_PATHS = {"/health", "/metrics", "/docs", "/openapi.json", "/favicon.ico"}
+    # Long-lived responses that open their own short DB sessions; rate-limited but uncapped
+    UNCAPPED_PATHS = {"/meetings/stream"}
+
+    def __init__(self, app: ASGIApp):
+        super().__init__(app)
+        local = TokenBucketLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        if RATE_LIMIT_REDIS_URI:
+            self.limiter = RedisTokenBucketLimiter(RATE_LIMIT_REDIS_URI, RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST, local)
+        else:
+            self.limiter = local
+        self.slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.waiting = 0
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        path = request.url.path
+        if path in self.EXCLUDED_PATHS:
+            return await call_next(request)
+
+        # Emails repeat across organizations, so buckets are per organization and user
+        user_key = request_user_key(request)
+        client_key = "user:{}:{}".format(*user_key) if user_key else f"ip:{request.client.host if request.client else 'unknown'}"
+        retry_after = await self.limiter.acquire(client_key)
+        if retry_after:
+            return self._reject(429, "Rate limit exceeded", retry_after)
+
+        if path in self.UNCAPPED_PATHS:
+            return await call_next(request)
+        if not await self._acquire_slot():
+            logger.warning(f"Shedding {request.method} {path}: {MAX_CONCURRENT_REQUESTS} requests in flight")
+            return self._reject(503, "Server is busy, try again shortly", 1)
+        try:
+            return await call_next(request)
+        finally:
+            self.slots.release()
+
+    async def _acquire_slot(self) -> bool:
+        if not self.slots.locked():
+            await self.slots.acquire()
+            return True
+        if self.waiting >= ADMISSION_QUEUE_SIZE:
+            return False
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self.slots.acquire(), ADMISSION_QUEUE_TIMEOUT_MS / 1000)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.waiting -= 1
+
+    @staticmethod
+    def _reject(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+        return JSONResponse(
+            status_code=status_code,
+            content={"detail": detail},
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
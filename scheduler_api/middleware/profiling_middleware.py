@@ -0,0 +1,119 @@
+import os
+import re
+import hmac
+import random
+import asyncio
+import logging
+from datetime import datetime, timezone
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Receive, Scope, Send, Message
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Requests carrying this value in PROFILE_HEADER are profiled; empty disables the header
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+# Fraction of all requests to profile at random
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+# Comma-separated emails whose requests are always profiled
+PROFILING_USERS = {e.strip().lower() for e in os.getenv("PROFILING_USERS", "").split(",") if e.strip()}
+PROFILING_OUTPUT_DIR = os.getenv("PROFILING_OUTPUT_DIR", "profiles")
+# speedscope (open in https://www.speedscope.app) or collapsed (flamegraph.pl, inferno)
+PROFILING_FORMAT = os.getenv("PROFILING_FORMAT", "speedscope")
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "1"))
+
+PROFILE_HEADER = b"x-profile-request"
+
+PROFILING_ENABLED = bool(PROFILING_TOKEN or PROFILING_SAMPLE_RATE > 0 or PROFILING_USERS)
+
+
+def collapsed_stacks(root) -> str:
+    """Render a pyinstrument frame tree as folded stacks weighted in microseconds."""
+    lines = []
+
+    def walk(frame, prefix):
+        name = f"{frame.function} ({frame.file_path_short}:{frame.line_no})"
+        stack = f"{prefix};{name}" if prefix else name
+        self_time = frame.time - sum(child.time for child in frame.children)
+        if self_time > 0:
+            lines.append(f"{stack} {round(self_time * 1_000_000)}")
+        for child in frame.children:
+            walk(child, stack)
+
+    if root is not None:
+        walk(root, "")
+    return "\n".join(lines) + "\n"
+
+
+class ProfilingMiddleware:
+    """
+    Wraps selected requests in pyinstrument's async-aware sampling profiler and
+    writes the profile to PROFILING_OUTPUT_DIR. A request is profiled when it
+    sends the PROFILING_TOKEN in ``X-Profile-Request``, comes from one of
+    PROFILING_USERS, or is picked by PROFILING_SAMPLE_RATE. Only one request
+    per process is profiled at a time.
+
+    main.py only installs this middleware when profiling is configured, and
+    pyinstrument is imported on first use.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._busy = False
+
+    def _wanted(self, scope: Scope) -> bool:
+        if PROFILING_TOKEN:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER and hmac.compare_digest(value, PROFILING_TOKEN.encode()):
+                    return True
+        if PROFILING_USERS:
+            # SecurityMiddleware runs outside this one and stores the caller in request.state
+            email = scope.get("state", {}).get("user_email")
+            if email and email.lower() in PROFILING_USERS:
+                return True
+        return PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or self._busy or not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        from pyinstrument import Profiler
+
+        self._busy = True
+        started = datetime.now(timezone.utc)
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", scope["path"].strip("/")) or "root"
+        extension = "speedscope.json" if PROFILING_FORMAT == "speedscope" else "collapsed.txt"
+        filename = f"{started:%Y%m%dT%H%M%S%f}-{scope['method']}-{slug[:60]}.{extension}"
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-File", filename)
+            await send(message)
+
+        profiler = Profiler(interval=PROFILING_INTERVAL_MS / 1000, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            self._busy = False
+            try:
+                await asyncio.to_thread(self._write, profiler, filename)
+            except Exception as e:
+                logger.error(f"Error writing profile {filename}: {e}")
+
+    @staticmethod
+    def _write(profiler, filename: str):
+        if PROFILING_FORMAT == "speedscope":
+            from pyinstrument.renderers import SpeedscopeRenderer
+            output = profiler.output(SpeedscopeRenderer())
+        else:
+            output = collapsed_stacks(profiler.last_session.root_frame())
+        os.makedirs(PROFILING_OUTPUT_DIR, exist_ok=True)
+        path = os.path.join(PROFILING_OUTPUT_DIR, filename)
+        with open(path, "w") as f:
+            f.write(output)
+        logger.info(f"Wrote request profile to {path}")
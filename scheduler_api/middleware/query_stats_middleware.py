@@ -0,0 +1,42 @@
+import logging
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Receive, Scope, Send, Message
+from core.query_stats import RequestQueryStats, current_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    Counts SQL statements and database time per request and reports them in a
+    ``Server-Timing`` header. Statements that run after the response starts
+    (the session commit in get_db, streamed bodies) still count towards the
+    repeated-statement check made once the request finishes.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_query_stats.reset(token)
+            for shape, count in stats.repeated():
+                logger.warning(
+                    f"{scope['method']} {scope['path']} ran the same statement {count} times "
+                    f"(possible N+1): {shape[:300]}"
+                )
@@ -1,10 +1,13 @@
 import os
 import re
 from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import HTTPException, Request
+from fastapi import Request
+from fastapi.responses import JSONResponse
 from jose import jwt
 from typing import Callable
 from starlette.types import ASGIApp
+from core.tracing import tracer
+from models.organization import DEFAULT_ORGANIZATION_ID
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,9 +16,11 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     EXCLUDED_PATHS = [
         "/auth/login",
         "/auth/register",
+        "/organizations/",
         "/docs",
         "/openapi.json",
         "/health",
+        "/metrics",
         "/favicon.ico"
     ]
     
@@ -34,23 +39,32 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         # Get Authorization header
         auth_header = request.headers.get("Authorization")
         if not auth_header:
-            raise HTTPException(status_code=401, detail="Authorization header missing")
+            return self._unauthorized("Authorization header missing")
         
         # Extract token
         parts = auth_header.split()
         if len(parts) != 2 or parts[0].lower() != "bearer":
-            raise HTTPException(status_code=401, detail="Invalid authorization header format")
+            return self._unauthorized("Invalid authorization header format")
         
         token = parts[1]
         
         try:
-            payload = jwt.decode(token, self.JWT_SECRET, algorithms=[self.ALGORITHM])
-            request.state.user_email = payload.get("sub")
-            if not request.state.user_email:
-                raise HTTPException(status_code=401, detail="Invalid token payload")
+            with tracer.start_as_current_span("jwt.decode"):
+                payload = jwt.decode(token, self.JWT_SECRET, algorithms=[self.ALGORITHM])
         except jwt.ExpiredSignatureError:
-            raise HTTPException(status_code=401, detail="Token has expired")
+            return self._unauthorized("Token has expired")
         except jwt.JWTError as e:
-            raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
+            return self._unauthorized(f"Invalid token: {str(e)}")
+        request.state.user_email = payload.get("sub")
+        if not request.state.user_email:
+            return self._unauthorized("Invalid token payload")
+        # Tokens issued before organizations existed belong to the default one
+        request.state.organization_id = payload.get("org", DEFAULT_ORGANIZATION_ID)
+        request.state.user_id = payload.get("uid")
         
-        return await call_next(request)
\ No newline at end of file
+        return await call_next(request)
+
+    @staticmethod
+    def _unauthorized(detail: str) -> JSONResponse:
+        # Exceptions raised in middleware skip FastAPI's handlers and become 500s
+        return JSONResponse(status_code=401, content={"detail": detail}, headers={"WWW-Authenticate": "Bearer"})
@@ -0,0 +1,56 @@
+from opentelemetry import context, trace
+from opentelemetry.propagate import extract
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from starlette.types import ASGIApp, Receive, Scope, Send, Message
+from core.tracing import tracer
+
+
+class TracingMiddleware:
+    """
+    Opens a server span per request, continuing the caller's trace when a W3C
+    ``traceparent`` header is present. The span is renamed to the matched
+    route template once routing has run. main.py only installs this
+    middleware when TRACING_ENABLED is set.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        method = scope["method"]
+        span = tracer.start_span(
+            f"{method} {scope['path']}",
+            context=extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]}
+        )
+        token = context.attach(trace.set_span_in_context(span))
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.response.status_code", message["status"])
+                if message["status"] >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, type(e).__name__))
+            raise
+        finally:
+            route = scope.get("route")
+            if route is not None:
+                span.update_name(f"{method} {route.path}")
+                span.set_attribute("http.route", route.path)
+            email = scope.get("state", {}).get("user_email")
+            if email:
+                span.set_attribute("enduser.id", email)
+            context.detach(token)
+            span.end()
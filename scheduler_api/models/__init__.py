@@ -1,4 +1,6 @@
+from .organization import *
 from .meeting import *
+from .meeting_change import *
 from .user import *
 from .base import *
 
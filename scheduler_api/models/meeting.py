@@ -1,20 +1,46 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Table,Integer
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, ForeignKey, ForeignKeyConstraint, Table, Integer, PrimaryKeyConstraint, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from models.base import Base
 from models.user import User
+from models.organization import Organization
 from sqlalchemy.sql import func
 
+# Carries the meeting's start_time so the table can be partitioned by month
+# alongside meetings; the ORM fills it through the attendees join condition.
 meeting_attendees = Table(
     'meeting_attendees', Base.metadata,
-    Column('meeting_id', ForeignKey('meetings.id'), primary_key=True),
-    Column('user_id', ForeignKey(User.id), primary_key=True)
+    Column('meeting_id', Integer, primary_key=True),
+    Column('user_id', ForeignKey(User.id), primary_key=True),
+    Column('meeting_start_time', DateTime(timezone=True), primary_key=True),
+    ForeignKeyConstraint(
+        ['meeting_id', 'meeting_start_time'],
+        ['meetings.id', 'meetings.start_time'],
+        onupdate='CASCADE',
+        ondelete='CASCADE'
+    )
+)
+
+# Text search configuration for meeting search; the generated column and queries must agree
+SEARCH_CONFIG = "english"
+# Title matches rank above description matches, which rank above location matches
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(location, '')), 'C')"
 )
 
 
 class Meeting(Base):
     __tablename__ = "meetings"
+    # Partitioned by month on start_time, so the partition key is part of every unique key;
+    # the ORM still identifies meetings by id alone (see __mapper_args__)
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "start_time", name="meetings_pkey"),
+        Index("ix_meetings_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, autoincrement=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -23,11 +49,22 @@ class Meeting(Base):
     start_time = Column(DateTime(timezone=True), nullable=False, index=True)
     end_time = Column(DateTime(timezone=True), nullable=False, index=True)
     location = Column(String(100), nullable=True)
+    organization_id = Column(ForeignKey(Organization.id), nullable=False, index=True)
     organizer_id = Column(ForeignKey(User.id), nullable=False)
     google_event_id = Column(String(255), nullable=True)
+    # Maintained by Postgres; only search queries read it
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
     
-    attendees = relationship("User", secondary=meeting_attendees)
+    attendees = relationship(
+        "User",
+        secondary=meeting_attendees,
+        primaryjoin="and_(Meeting.id == meeting_attendees.c.meeting_id, "
+                    "Meeting.start_time == meeting_attendees.c.meeting_start_time)",
+        secondaryjoin="User.id == meeting_attendees.c.user_id"
+    )
     organizer = relationship("User", back_populates="organized_meetings")
 
+    __mapper_args__ = {"primary_key": [id]}
+
 
 
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, BigInteger, Index, text
+from models.base import Base
+from models.user import User
+from sqlalchemy.sql import func
+
+
+class MeetingChange(Base):
+    """
+    Append-only change log driving delta sync. One row per affected user per
+    meeting write. ``version`` comes from the writing transaction's id
+    (migration 0007), so versions below meeting_change_horizon() belong to
+    finished transactions only. meeting_id has no foreign key so tombstones
+    outlive the meetings they describe.
+    """
+    __tablename__ = "meeting_changes"
+    __table_args__ = (Index("ix_meeting_changes_user_id_version", "user_id", "version"),)
+
+    id = Column(BigInteger, primary_key=True)
+    version = Column(BigInteger, nullable=False, server_default=text("meeting_change_version()"))
+    changed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    user_id = Column(ForeignKey(User.id), nullable=False)
+    meeting_id = Column(Integer, nullable=False)
+    op = Column(String(10), nullable=False)  # "upsert" or "delete"
+
+
+class MeetingChangeLogState(Base):
+    """Single row: the highest version removed by retention; older sync versions must resync."""
+    __tablename__ = "meeting_change_log_state"
+
+    id = Column(Integer, primary_key=True)
+    purged_through = Column(BigInteger, nullable=False, server_default="0")
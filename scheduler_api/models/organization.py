@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, DateTime, Integer
+from sqlalchemy.sql import func
+from models.base import Base
+
+# Every tenant-owned table references this organization until told otherwise
+DEFAULT_ORGANIZATION_ID = 1
+DEFAULT_SHARD = "default"
+
+
+class Organization(Base):
+    """
+    A customer organization (tenant). The copy on the default shard is the
+    directory entry saying which shard holds the tenant's data; tenants on
+    other shards also get a row there, under the same id, for foreign keys.
+    """
+    __tablename__ = "organizations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    name = Column(String(100), nullable=False)
+    slug = Column(String(50), unique=True, index=True, nullable=False)
+    shard = Column(String(50), nullable=False, default=DEFAULT_SHARD, server_default=DEFAULT_SHARD)
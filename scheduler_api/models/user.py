@@ -1,17 +1,21 @@
-from sqlalchemy import Column, String, Boolean,Integer,DateTime
+from sqlalchemy import Column, String, Boolean,Integer,DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from models.base import Base
+from models.organization import Organization
 
 
 class User(Base):
     __tablename__ = "users"
+    # Email addresses are unique within an organization, not across them
+    __table_args__ = (UniqueConstraint("organization_id", "email", name="uq_users_organization_id_email"),)
     
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    email = Column(String(255), unique=True, index=True, nullable=False)
+    organization_id = Column(ForeignKey(Organization.id), nullable=False, index=True)
+    email = Column(String(255), index=True, nullable=False)
     full_name = Column(String(100), nullable=False)
     hashed_password = Column(String(255), nullable=True)  # For local auth
     is_active = Column(Boolean, default=True)
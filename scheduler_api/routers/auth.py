@@ -1,9 +1,13 @@
 import os
-from fastapi import APIRouter, Depends, HTTPException, status, Request  
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Form
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from core.database import shard_router
 from core.security import create_access_token, hash_password, verify_password
+from crud.organization import get_organization_by_slug
 from crud.user import create_user, get_user_by_email
+from models.organization import DEFAULT_ORGANIZATION_ID
 from dependencies import get_db
 from schemas import UserCreate, Token, User
 import logging
@@ -51,12 +55,24 @@ async def register_user(user: UserCreate,db: AsyncSession = Depends(get_db)):
 @router.post("/login", response_model=Token)
 async def login_user(
     form_data: OAuth2PasswordRequestForm = Depends(),
+    organization: Optional[str] = Form(None, description="Organization slug; the default organization when omitted"),
     db: AsyncSession = Depends(get_db)
 ):
     """Authenticate user and return JWT token."""
-    user = await get_user_by_email(db, form_data.username)
+    organization_id = DEFAULT_ORGANIZATION_ID
+    if organization:
+        # The directory lives on the default shard, which ``db`` is on
+        org = await get_organization_by_slug(db, organization)
+        organization_id = org.id if org else None
+
+    user = None
+    if organization_id is not None:
+        shard = await shard_router.shard_for(organization_id)
+        async with shard_router.session(shard, organization_id) as org_db:
+            user = await get_user_by_email(org_db, form_data.username)
     print(user)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Invite-only accounts have no password yet
+    if not user or not user.hashed_password or not verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -64,7 +80,7 @@ async def login_user(
         )
     
     # Create access token
-    access_token = create_access_token(data={"sub": user.email})
+    access_token = create_access_token(data={"sub": user.email, "org": organization_id, "uid": user.id})
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/me", response_model=User)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from dependencies import get_db
-from services.conflict_checker import has_time_conflict
+from services.single_flight import shared_time_conflict
 from crud.user import get_user_by_email
 import logging
 from utils.time_utils import ensure_utc
@@ -23,7 +23,7 @@ async def check_availability(
             raise HTTPException(status_code=404, detail="User not found")
         start_utc = ensure_utc(start)
         end_utc = ensure_utc(end)
-        is_conflict = await has_time_conflict(db, start_utc, end_utc, [user.id])
+        is_conflict = await shared_time_conflict(db, start_utc, end_utc, [user.id])
         return {
             "available": not is_conflict,
             "user_id": user.id,
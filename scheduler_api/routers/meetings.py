@@ -1,38 +1,69 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query, Path
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from schemas.meeting import MeetingCreate, Meeting, MeetingUpdate
-from dependencies import get_db, get_current_active_user
+from schemas.meeting import (
+    MeetingCreate, Meeting, MeetingUpdate, ScheduleBatchRequest, ScheduleBatchResult,
+    MeetingBulkCancel, MeetingBulkCancelResult, MeetingChangesPage, MeetingSummary, MeetingSearchPage
+)
+from dependencies import get_db, get_current_active_user, request_organization_id
+from core.database import shard_router
+from crud.user import get_user_by_email
 from crud import meeting as crud
 from services.calendar_adapter import GoogleCalendarAdapter
+from services.batch_scheduler import schedule_batch
+from services.conflict_checker import SchedulingConflict
+from services.booking_coalescer import booking_coalescer, BOOKING_GROUP_COMMIT
+from services.notification_service import notify_meetings_cancelled
+from services.change_events import change_broadcasters
+from services.single_flight import shared_user_meetings_in_range
+import os
+import json
+import asyncio
 import logging
+import pytz
 from datetime import datetime
 from utils.time_utils import ensure_utc
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("STREAM_HEARTBEAT_SECONDS", "15"))
+
 @router.post("/", response_model=Meeting, status_code=status.HTTP_201_CREATED)
 async def create_meeting(
     meeting: MeetingCreate,
     request: Request,
+    alternatives: int = Query(3, ge=0, le=20, description="Alternative start times to suggest on conflict"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_active_user)
 ):
     """Create a new meeting."""
     try:
-        # Create meeting
-        db_meeting = await crud.create_meeting(db, meeting, current_user.id)
+        # Create meeting, grouped with concurrent bookings when group commit is enabled
+        if BOOKING_GROUP_COMMIT:
+            db_meeting = await booking_coalescer.submit(db, meeting, current_user.id, alternatives)
+        else:
+            db_meeting = await crud.create_meeting(db, meeting, current_user.id, alternatives)
         
         # Sync to Google Calendar if enabled
         if current_user.google_id:
             calendar = GoogleCalendarAdapter(current_user.google_credentials)
             google_event_id = await calendar.create_event(meeting)
             if google_event_id:
+                if BOOKING_GROUP_COMMIT:
+                    # The grouped meeting belongs to the coalescer's session
+                    db_meeting = await db.merge(db_meeting)
                 db_meeting.google_event_id = google_event_id
                 await db.commit()
                 await db.refresh(db_meeting)
         
         return db_meeting
+    except SchedulingConflict as e:
+        logger.warning(f"Scheduling conflict: {len(e.report.conflicts)} overlapping meetings")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=e.report.model_dump(mode="json")
+        )
     except ValueError as e:
         logger.warning(f"Scheduling conflict: {e}")
         raise HTTPException(
@@ -46,6 +77,124 @@ async def create_meeting(
             detail="Internal server error"
         )
 
+@router.post("/schedule", response_model=ScheduleBatchResult, status_code=status.HTTP_201_CREATED)
+async def schedule_meetings(
+    batch: ScheduleBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Automatically place a batch of meeting requests and create them atomically."""
+    try:
+        scheduled, unplaced = await schedule_batch(db, batch, current_user.id)
+        return {"scheduled": scheduled, "unplaced": unplaced}
+    except ValueError as e:
+        logger.warning(f"Scheduling conflict: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error scheduling meetings: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+@router.post("/bulk-cancel", response_model=MeetingBulkCancelResult)
+async def bulk_cancel_meetings(
+    filters: MeetingBulkCancel,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """
+    Delete the current user's meetings matching the filters and notify
+    everyone affected. Only meetings the caller organizes are cancelled.
+    """
+    if filters.organizer_email and filters.organizer_email != current_user.email:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only meetings you organize can be cancelled"
+        )
+    try:
+        deleted, by_user = await crud.delete_meetings(db, filters, current_user.id)
+        await notify_meetings_cancelled(by_user)
+        return {"deleted": len(deleted), "meeting_ids": [m["id"] for m in deleted]}
+    except crud.BulkCancelInterrupted as e:
+        # Earlier batches are committed: tell those attendees, and the caller what was done
+        logger.error(f"Bulk cancel interrupted after {len(e.deleted)} meetings: {e.__cause__}")
+        await notify_meetings_cancelled(e.by_user)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "message": "Bulk cancel stopped partway; the listed meetings were cancelled",
+                "deleted": len(e.deleted),
+                "meeting_ids": [m["id"] for m in e.deleted]
+            }
+        )
+    except Exception as e:
+        logger.error(f"Error cancelling meetings: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+@router.get("/stream")
+async def stream_meeting_changes(request: Request):
+    """Server-Sent Events feed of create/update/delete deltas affecting the current user."""
+    if not hasattr(request.state, "user_email"):
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    # Resolve the user in a short-lived session: a Depends(get_db) session would
+    # stay checked out of the pool for as long as the stream is open
+    organization_id = request_organization_id(request)
+    shard = await shard_router.shard_for(organization_id)
+    async with shard_router.session(shard, organization_id) as db:
+        user = await get_user_by_email(db, request.state.user_email)
+    if not user or not user.is_active:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    change_broadcaster = change_broadcasters[shard]
+    queue = await change_broadcaster.subscribe(user.id)
+
+    async def events():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['op']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            change_broadcaster.unsubscribe(user.id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/changes", response_model=MeetingChangesPage)
+async def get_meeting_changes(
+    since: int = Query(0, ge=0, description="Version returned by the previous sync; 0 starts a full sync"),
+    limit: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """
+    Meetings created, updated or removed on the current user's calendar since
+    a version. With since=0 only the current version is returned: take it,
+    then load the calendar, then sync from it.
+    """
+    page = await crud.get_meeting_changes(db, current_user.id, since, limit)
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Change history expired; perform a full sync"
+        )
+    changes, version, has_more = page
+    return {"version": version, "has_more": has_more, "changes": changes}
+
 @router.get("/", response_model=list[Meeting])
 async def get_meetings(
     request: Request,
@@ -59,7 +208,7 @@ async def get_meetings(
         if start and end:
             start_utc = ensure_utc(start)
             end_utc = ensure_utc(end)
-            return await crud.get_user_meetings_in_range(db, current_user.id, start_utc, end_utc)
+            return await shared_user_meetings_in_range(db, current_user.id, start_utc, end_utc)
         return await crud.get_user_meetings(db, current_user.id)
     except Exception as e:
         logger.error(f"Error getting meetings: {e}")
@@ -68,14 +217,75 @@ async def get_meetings(
             detail="Internal server error"
         )
 
+@router.get("/summary", response_model=MeetingSummary)
+async def get_meeting_summary(
+    start: datetime = Query(..., description="Start of the visible range"),
+    end: datetime = Query(..., description="End of the visible range (exclusive)"),
+    tz: str = Query("UTC", description="Time zone whose calendar days the counts use"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Per-day counts and id/title/time stubs for the current user's meetings starting in a range."""
+    if tz not in pytz.all_timezones_set:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown time zone: {tz}")
+    start_utc = ensure_utc(start)
+    end_utc = ensure_utc(end)
+    if end_utc <= start_utc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="End must be after start")
+    days, stubs = await crud.get_user_meeting_summary(db, current_user.id, start_utc, end_utc, tz)
+    return {
+        "start": start_utc,
+        "end": end_utc,
+        "timezone": tz,
+        "days": [{"date": row.date, "count": row.count} for row in days],
+        "meetings": stubs
+    }
+
+@router.get("/search", response_model=MeetingSearchPage)
+async def search_meetings(
+    q: str = Query(..., min_length=1, max_length=200, description="Words, \"phrases\", or and -exclusions"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Full-text search over the title, description and location of the current user's meetings."""
+    try:
+        results, next_cursor = await crud.search_user_meetings(db, current_user.id, q, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"results": results, "next_cursor": next_cursor}
+
+@router.get("/{meeting_id}", response_model=Meeting)
+async def get_meeting(
+    meeting_id: int = Path(..., description="ID of the meeting to fetch"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Full details of a meeting the current user organizes or attends."""
+    meeting = await crud.get_user_meeting(db, meeting_id, current_user.id)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    return meeting
+
 @router.put("/{meeting_id}", response_model=Meeting)
 async def update_meeting(
     meeting_id: int = Path(..., description="ID of the meeting to update"),
     meeting_update: MeetingUpdate = None,
+    alternatives: int = Query(3, ge=0, le=20, description="Alternative start times to suggest on conflict"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_active_user)
 ):
-    updated = await crud.update_meeting(db, meeting_id, meeting_update)
+    try:
+        updated = await crud.update_meeting(db, meeting_id, meeting_update, alternatives)
+    except SchedulingConflict as e:
+        logger.warning(f"Scheduling conflict on update: {len(e.report.conflicts)} overlapping meetings")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=e.report.model_dump(mode="json")
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     if not updated:
         raise HTTPException(status_code=404, detail="Meeting not found")
     return updated
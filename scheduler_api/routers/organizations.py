@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.security import hash_password
+from crud.organization import create_organization
+from dependencies import get_db
+from schemas import OrganizationCreate, Organization, UserCreate
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.post("/", response_model=Organization, status_code=status.HTTP_201_CREATED)
+async def create_new_organization(body: OrganizationCreate, db: AsyncSession = Depends(get_db)):
+    """Create an organization on the least loaded shard, with its first user."""
+    try:
+        organization = await create_organization(db, body.name, body.slug, UserCreate(
+            email=body.owner.email,
+            full_name=body.owner.full_name,
+            password=hash_password(body.owner.password)
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    logger.info(f"Created organization {organization.slug} on shard {organization.shard}")
+    return organization
@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from dependencies import get_db, get_current_active_user
+from schemas import UserSummary, UserImportResult
+from services.user_directory import search_users, USER_SEARCH_CACHE_TTL_SECONDS
+from services.user_import import can_import_users, iter_csv_records, iter_lines, parse_csv, parse_ndjson, import_users
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.get("/search", response_model=list[UserSummary])
+async def search_directory(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=100, description="Email or name fragment"),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Find active users by email or name for attendee typeahead."""
+    response.headers["Cache-Control"] = f"private, max-age={int(USER_SEARCH_CACHE_TTL_SECONDS)}"
+    return await search_users(db, q, limit)
+
+@router.post("/import", response_model=UserImportResult)
+async def import_directory(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """
+    Bulk-create users from a streamed CSV (text/csv, header row with email,
+    full_name and optional password) or NDJSON (application/x-ndjson) body.
+    Rows without a password become invite-only accounts. Only users listed
+    in USER_IMPORT_ADMINS may import, and only into their own organization.
+    """
+    if not can_import_users(current_user):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to import users")
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type == "text/csv":
+        rows = parse_csv(iter_csv_records(request.stream()))
+    elif content_type in ("application/x-ndjson", "application/jsonl"):
+        rows = parse_ndjson(iter_lines(request.stream()))
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson"
+        )
+    try:
+        results = await import_users(db, rows)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    created = sum(1 for r in results if r["status"] == "created")
+    failed = sum(1 for r in results if r["status"] == "invalid")
+    return {
+        "created": created,
+        "skipped": len(results) - created - failed,
+        "failed": failed,
+        "results": results
+    }
@@ -1,2 +1,3 @@
 from .meeting import *
-from .user import *
\ No newline at end of file
+from .user import *
+from .organization import *
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, field_validator, computed_field
-from datetime import datetime
+from pydantic import BaseModel, Field, field_validator, model_validator, computed_field
+from datetime import datetime, date
 from typing import List, Optional
 from .user import User
 
@@ -47,4 +47,103 @@ class Meeting(MeetingBase):
     @computed_field
     @property
     def end_time_utc(self) -> str:
-        return self.end_time.isoformat() + "Z"
\ No newline at end of file
+        return self.end_time.isoformat() + "Z"
+
+class TimeWindow(BaseModel):
+    start: datetime
+    end: datetime
+
+    @field_validator('end')
+    def end_after_start(cls, v, values):
+        if 'start' in values.data and v <= values.data['start']:
+            raise ValueError("Window end must be after window start")
+        return v
+
+class MeetingRequest(BaseModel):
+    """An unplaced meeting: who, how long and when it may happen."""
+    title: str
+    description: Optional[str] = None
+    location: Optional[str] = None
+    attendee_emails: List[str] = []
+    duration_minutes: int = Field(gt=0, le=24 * 60)
+    windows: List[TimeWindow] = Field(min_length=1)
+
+class ScheduleBatchRequest(BaseModel):
+    requests: List[MeetingRequest] = Field(min_length=1, max_length=500)
+    time_budget_seconds: float = Field(default=5.0, gt=0, le=60)
+    slot_minutes: int = Field(default=15, gt=0, le=240)
+
+class ScheduleBatchResult(BaseModel):
+    scheduled: List[Meeting]
+    unplaced: List[int]
+
+class ConflictingMeeting(BaseModel):
+    user_id: int
+    email: str
+    meeting_id: int
+    title: str
+    start_time: datetime
+    end_time: datetime
+
+class ConflictReport(BaseModel):
+    message: str = "Scheduling conflict detected"
+    conflicts: List[ConflictingMeeting]
+    alternatives: List[datetime]
+
+class MeetingBulkCancel(BaseModel):
+    """Filters selecting the meetings to cancel; at least one is required."""
+    ids: Optional[List[int]] = None
+    organizer_email: Optional[str] = None
+    attendee_email: Optional[str] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    batch_size: int = Field(default=500, gt=0, le=5000)
+
+    @model_validator(mode='after')
+    def require_filter(self):
+        if not any([self.ids, self.organizer_email, self.attendee_email, self.start, self.end]):
+            raise ValueError("At least one filter is required")
+        return self
+
+class MeetingBulkCancelResult(BaseModel):
+    deleted: int
+    meeting_ids: List[int]
+
+class MeetingChangeEntry(BaseModel):
+    version: int
+    op: str  # "upsert" or "delete"
+    meeting_id: int
+    meeting: Optional[Meeting] = None
+
+class MeetingChangesPage(BaseModel):
+    version: int
+    has_more: bool
+    changes: List[MeetingChangeEntry]
+
+class MeetingStub(BaseModel):
+    id: int
+    title: str
+    start_time: datetime
+    end_time: datetime
+
+class MeetingSearchHit(MeetingStub):
+    description: Optional[str] = None
+    location: Optional[str] = None
+    rank: float
+
+class MeetingSearchPage(BaseModel):
+    """Search hits, best match first; pass next_cursor back for the following page."""
+    results: List[MeetingSearchHit]
+    next_cursor: Optional[str] = None
+
+class DaySummary(BaseModel):
+    date: date
+    count: int
+
+class MeetingSummary(BaseModel):
+    """Calendar-view payload: per-day counts and stubs; fetch details per meeting."""
+    start: datetime
+    end: datetime
+    timezone: str
+    days: List[DaySummary]
+    meetings: List[MeetingStub]
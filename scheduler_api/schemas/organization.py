@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from .user import UserCreate
+
+class OrganizationCreate(BaseModel):
+    """A new organization and the account of the person creating it."""
+    name: str = Field(min_length=1, max_length=100)
+    slug: str = Field(min_length=1, max_length=50, pattern=r"^[a-z0-9][a-z0-9-]*$")
+    owner: UserCreate
+
+class Organization(BaseModel):
+    id: int
+    name: str
+    slug: str
+    created_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
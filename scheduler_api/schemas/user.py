@@ -1,13 +1,17 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
+from typing import List, Optional
+
 
 class UserBase(BaseModel):
     email: EmailStr
     full_name: str
 
+
 class UserCreate(UserBase):
     password: str
 
+
 class User(UserBase):
     id: int
     is_active: bool
@@ -17,6 +21,40 @@ class User(UserBase):
         "from_attributes": True  # Replaces orm_mode = True
     }
 
+
 class Token(BaseModel):
     access_token: str
-    token_type: str
\ No newline at end of file
+    token_type: str
+
+
+class UserSummary(BaseModel):
+    """Directory entry returned by user search."""
+    id: int
+    email: str
+    full_name: str
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class UserImportRow(BaseModel):
+    """One user in a bulk import; without a password the account is invite-only."""
+    email: EmailStr
+    full_name: str = Field(min_length=1, max_length=100)
+    password: Optional[str] = None
+
+
+class UserImportRowResult(BaseModel):
+    row: int
+    email: Optional[str] = None
+    status: str  # "created", "exists", "duplicate" or "invalid"
+    user_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class UserImportResult(BaseModel):
+    created: int
+    skipped: int
+    failed: int
+    results: List[UserImportRowResult]
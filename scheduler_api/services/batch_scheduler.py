@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from crud import meeting as crud
+from crud.user import get_users_by_emails
+from schemas.meeting import MeetingCreate, ScheduleBatchRequest
+from services import placement_solver
+from services.conflict_checker import get_busy_intervals
+from utils.time_utils import ensure_utc
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _epoch(dt: datetime) -> int:
+    return int(ensure_utc(dt).timestamp())
+
+
+async def schedule_batch(db, batch: ScheduleBatchRequest, organizer_id: int):
+    """
+    Place a batch of meeting requests and store the result in one transaction.
+
+    Busy calendars are loaded once for every attendee, placement runs in the
+    solver process pool and the placed meetings are committed together.
+    Returns the created meetings and the indexes of requests left unplaced.
+    """
+    users = await get_users_by_emails(db, [email for r in batch.requests for email in r.attendee_emails])
+    ids_by_email = {u.email: u.id for u in users}
+
+    windows = [w for r in batch.requests for w in r.windows]
+    busy = await get_busy_intervals(
+        db,
+        list(ids_by_email.values()) + [organizer_id],
+        min(w.start for w in windows),
+        max(w.end for w in windows)
+    )
+
+    payload = []
+    for request in batch.requests:
+        attendee_ids = sorted({ids_by_email[e] for e in request.attendee_emails if e in ids_by_email})
+        payload.append({
+            "duration": request.duration_minutes * 60,
+            "windows": [(_epoch(w.start), _epoch(w.end)) for w in request.windows],
+            # The organizer is busy during every placed meeting too
+            "check_ids": sorted(set(attendee_ids) | {organizer_id}),
+        })
+    busy_epochs = {
+        user_id: [(_epoch(s), _epoch(e)) for s, e in intervals]
+        for user_id, intervals in busy.items()
+    }
+
+    solution = await placement_solver.solve(
+        payload, busy_epochs, batch.slot_minutes * 60, batch.time_budget_seconds
+    )
+    logger.info(
+        f"Batch scheduling placed {len(solution['placements'])} of {len(payload)} requests"
+    )
+
+    meetings = []
+    for index, start in sorted(solution["placements"].items()):
+        request = batch.requests[index]
+        meetings.append(MeetingCreate(
+            title=request.title,
+            description=request.description,
+            location=request.location,
+            attendee_emails=request.attendee_emails,
+            start_time=datetime.fromtimestamp(start, timezone.utc),
+            end_time=datetime.fromtimestamp(start + payload[index]["duration"], timezone.utc)
+        ))
+    scheduled = await crud.create_meetings_bulk(db, meetings, organizer_id) if meetings else []
+    return scheduled, solution["unplaced"]
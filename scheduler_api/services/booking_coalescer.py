@@ -0,0 +1,108 @@
+import os
+import asyncio
+import logging
+from core.database import AsyncSessionLocal
+from crud import meeting as crud
+from schemas.meeting import MeetingCreate
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Opt-in group commit for POST /meetings/
+BOOKING_GROUP_COMMIT = os.getenv("BOOKING_GROUP_COMMIT", "false").lower() == "true"
+BOOKING_GROUP_WINDOW_MS = float(os.getenv("BOOKING_GROUP_WINDOW_MS", "5"))
+BOOKING_GROUP_MAX_SIZE = int(os.getenv("BOOKING_GROUP_MAX_SIZE", "64"))
+
+
+class BookingCoalescer:
+    """
+    Collects bookings that arrive within a short window and commits them
+    together through crud.create_meetings_group, then hands each waiting
+    caller its own result or exception. Bookings are grouped per database and
+    organization, since one transaction cannot span shards.
+    """
+
+    def __init__(self, window_ms: float = BOOKING_GROUP_WINDOW_MS, max_size: int = BOOKING_GROUP_MAX_SIZE):
+        self.window = window_ms / 1000
+        self.max_size = max_size
+        self._pending = {}
+        self._timers = {}
+        self._tasks = set()
+
+    async def submit(self, db, meeting: MeetingCreate, organizer_id: int, alternatives: int = 3):
+        """
+        Queue a booking and wait for the group it lands in to commit. ``db``
+        only selects the database and organization; the group commits in its
+        own session.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (db.bind, db.info.get("organization_id"))
+        pending = self._pending.setdefault(key, [])
+        pending.append((meeting, organizer_id, alternatives, future))
+        if len(pending) >= self.max_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+        return await future
+
+    def _flush(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._pending.pop(key, [])
+        if group:
+            task = asyncio.create_task(self._commit_group(key, group))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _session(self, key):
+        bind, organization_id = key
+        return AsyncSessionLocal(bind=bind, info={"organization_id": organization_id})
+
+    async def _commit_group(self, key, group):
+        # Reports for rejected bookings use the largest count any caller asked for
+        alternatives = max(item[2] for item in group)
+        try:
+            async with self._session(key) as db:
+                outcomes = await crud.create_meetings_group(
+                    db, [(meeting, organizer_id) for meeting, organizer_id, _, _ in group], alternatives
+                )
+        except Exception as e:
+            # Never let one bad booking fail its neighbours: replay the group one by one
+            logger.warning(f"Group commit of {len(group)} bookings failed, retrying individually: {e}")
+            await asyncio.gather(*(self._commit_single(key, *item) for item in group))
+            return
+
+        for (_, _, limit, future), outcome in zip(group, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                outcome.report.alternatives = outcome.report.alternatives[:limit]
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _commit_single(self, key, meeting, organizer_id, alternatives, future):
+        try:
+            async with self._session(key) as db:
+                result = await crud.create_meeting(db, meeting, organizer_id, alternatives)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self):
+        """Flush anything still queued and wait for in-flight groups."""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+booking_coalescer = BookingCoalescer()
@@ -1,12 +1,19 @@
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from schemas.meeting import Meeting
+from core.metrics import CALENDAR_ADAPTER_DURATION
+from core.tracing import tracer
+from opentelemetry.trace import SpanKind, Status, StatusCode
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
 class GoogleCalendarAdapter:
     def __init__(self, credentials: dict):
+        # The Google client libraries take a noticeable share of startup time;
+        # only users with Google sync pay for them, on first use
+        from google.oauth2.credentials import Credentials
+        from googleapiclient.discovery import build
+
         self.creds = Credentials.from_authorized_user_info(credentials)
         self.service = build('calendar', 'v3', credentials=self.creds)
 
@@ -21,13 +28,23 @@ class GoogleCalendarAdapter:
             'reminders': {'useDefault': True}
         }
         
-        try:
-            created_event = self.service.events().insert(
-                calendarId='primary',
-                body=event,
-                sendUpdates='all'
-            ).execute()
-            return created_event['id']
-        except Exception as e:
-            logger.error(f"Google Calendar error: {e}")
-            return None
\ No newline at end of file
+        started = time.perf_counter()
+        with tracer.start_as_current_span("google_calendar.create_event", kind=SpanKind.CLIENT) as span:
+            try:
+                request = self.service.events().insert(
+                    calendarId='primary',
+                    body=event,
+                    sendUpdates='all'
+                )
+                # Pass the trace on in a W3C traceparent header
+                from opentelemetry.propagate import inject
+                inject(request.headers)
+                created_event = request.execute()
+                CALENDAR_ADAPTER_DURATION.labels("create_event", "success").observe(time.perf_counter() - started)
+                return created_event['id']
+            except Exception as e:
+                CALENDAR_ADAPTER_DURATION.labels("create_event", "error").observe(time.perf_counter() - started)
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR))
+                logger.error(f"Google Calendar error: {e}")
+                return None
\ No newline at end of file
@@ -0,0 +1,148 @@
+import os
+import json
+import asyncio
+import logging
+import asyncpg
+from sqlalchemy import text, bindparam, insert, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from core.database import SHARD_URIS
+from models import MeetingChange
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "meeting_changes"
+# NOTIFY payloads are limited to 8000 bytes, so long attendee lists are split
+MAX_USER_IDS_PER_NOTIFY = 500
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("CHANGE_STREAM_QUEUE_SIZE", "256"))
+
+
+def meeting_stub(meeting) -> dict:
+    """Compact description of a meeting for change payloads; accepts ORM objects or row mappings."""
+    get = meeting.get if isinstance(meeting, dict) else lambda key: getattr(meeting, key)
+    return {
+        "id": get("id"),
+        "title": get("title"),
+        "start_time": get("start_time").isoformat(),
+        "end_time": get("end_time").isoformat()
+    }
+
+
+async def record_meeting_changes(db, changes: list[tuple[str, dict, list[int]]]):
+    """
+    Record (op, meeting stub, affected user ids) changes made in the caller's
+    transaction: one meeting_changes row per user for delta sync, plus a
+    NOTIFY for live listeners. Both become visible only if that transaction
+    commits. ``op`` is "created", "updated" or "deleted".
+    """
+    rows = []
+    payloads = []
+    for op, stub, user_ids in changes:
+        user_ids = sorted(set(user_ids))
+        if not user_ids:
+            continue
+        log_op = "delete" if op == "deleted" else "upsert"
+        rows.extend({"user_id": user_id, "meeting_id": stub["id"], "op": log_op} for user_id in user_ids)
+        for i in range(0, len(user_ids), MAX_USER_IDS_PER_NOTIFY):
+            payloads.append(json.dumps({
+                "op": op,
+                "meeting": stub,
+                "user_ids": user_ids[i:i + MAX_USER_IDS_PER_NOTIFY]
+            }))
+    if rows:
+        await db.execute(insert(MeetingChange), rows)
+    if payloads:
+        stmt = text(
+            "SELECT pg_notify(:channel, payload) FROM unnest(:payloads) AS payload"
+        ).bindparams(bindparam("payloads", type_=ARRAY(Text)))
+        await db.execute(stmt, {"channel": CHANNEL, "payloads": payloads})
+
+
+class ChangeBroadcaster:
+    """
+    Holds one LISTEN connection per process and fans each notification out
+    to the queues of the users it affects. NOTIFY only reaches listeners on
+    the same database, so there is one broadcaster per shard.
+    """
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self._conn = None
+        self._lock = asyncio.Lock()
+        self._subscribers = {}
+        self._tasks = set()
+
+    async def subscribe(self, user_id: int) -> asyncio.Queue:
+        await self._ensure_listening()
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue):
+        queues = self._subscribers.get(user_id)
+        if queues:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+
+    async def _ensure_listening(self):
+        async with self._lock:
+            if self._conn is None or self._conn.is_closed():
+                self._conn = await asyncpg.connect(self.dsn)
+                self._conn.add_termination_listener(self._on_terminate)
+                await self._conn.add_listener(CHANNEL, self._on_notify)
+
+    def _deliver(self, queue: asyncio.Queue, event: dict):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # The client fell behind; drop its backlog and ask it to refetch
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"op": "resync"})
+
+    def _on_notify(self, connection, pid, channel, payload):
+        change = json.loads(payload)
+        event = {"op": change["op"], "meeting": change["meeting"]}
+        for user_id in change["user_ids"]:
+            for queue in self._subscribers.get(user_id, ()):
+                self._deliver(queue, event)
+
+    def _on_terminate(self, connection):
+        # Notifications may have been missed while disconnected
+        logger.warning("Change stream LISTEN connection lost; reconnecting")
+        self._conn = None
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._deliver(queue, {"op": "resync"})
+        task = asyncio.get_running_loop().create_task(self._reconnect())
+        # The loop only keeps weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _reconnect(self):
+        delay = 1
+        while self._subscribers:
+            try:
+                await self._ensure_listening()
+                return
+            except Exception as e:
+                logger.error(f"Change stream reconnect failed: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+
+    async def close(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._conn is not None and not self._conn.is_closed():
+            self._conn.remove_termination_listener(self._on_terminate)
+            await self._conn.close()
+        self._conn = None
+
+
+# User ids are only unique within a shard
+change_broadcasters = {shard: ChangeBroadcaster(uri.replace("+asyncpg", "")) for shard, uri in SHARD_URIS.items()}
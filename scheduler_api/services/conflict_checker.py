@@ -1,7 +1,46 @@
-from sqlalchemy import select, and_, or_, not_
-from datetime import datetime
-from models import Meeting, User
+from sqlalchemy import select, and_, or_, not_, text, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from models import Meeting, User, meeting_attendees
+from schemas.meeting import ConflictReport
 from utils.time_utils import ensure_utc
+from core.metrics import CONFLICT_CHECKS
+from core.tracing import tracer
+
+# First key of the two-int advisory lock space, reserved for per-user booking locks
+BOOKING_LOCK_NAMESPACE = 0x5C4E
+
+ALTERNATIVE_STEP = timedelta(minutes=15)
+ALTERNATIVE_HORIZON = timedelta(days=7)
+
+# Joining on the partition key too lets Postgres match partitions pairwise
+attendee_join = and_(
+    meeting_attendees.c.meeting_id == Meeting.id,
+    meeting_attendees.c.meeting_start_time == Meeting.start_time
+)
+
+
+class SchedulingConflict(ValueError):
+    """Raised when a meeting overlaps existing ones; carries the full conflict report."""
+
+    def __init__(self, report: ConflictReport):
+        super().__init__(report.message)
+        self.report = report
+
+async def lock_attendees(db, user_ids: list[int]):
+    """
+    Take transaction-scoped advisory locks on each user id, in ascending order.
+
+    Call this before checking conflicts and keep the insert in the same
+    transaction: bookings sharing a user serialize on that user's lock, while
+    bookings for disjoint users never wait on each other. Sorting the ids
+    gives every transaction the same lock order so they cannot deadlock.
+    """
+    stmt = text(
+        "SELECT pg_advisory_xact_lock(:namespace, user_id) FROM unnest(:user_ids) AS user_id"
+    ).bindparams(bindparam("user_ids", type_=ARRAY(Integer)))
+    await db.execute(stmt, {"namespace": BOOKING_LOCK_NAMESPACE, "user_ids": sorted(set(user_ids))})
 
 async def has_time_conflict(db, start: datetime, end: datetime, user_ids: list[int], exclude_meeting_id: int = None):
     """
@@ -11,26 +50,146 @@ async def has_time_conflict(db, start: datetime, end: datetime, user_ids: list[i
     start_utc = ensure_utc(start)
     end_utc = ensure_utc(end)
     
+    # Closed-interval overlap (touching meetings count as conflicts). Keeping the
+    # start_time bound on its own lets Postgres prune later monthly partitions.
     conditions = [
-        User.id.in_(user_ids),
-        or_(
-            and_(
-                Meeting.start_time < end_utc,
-                Meeting.end_time > start_utc
-            ),
-            Meeting.start_time.between(start_utc, end_utc),
-            Meeting.end_time.between(start_utc, end_utc)
-        )
+        meeting_attendees.c.user_id.in_(user_ids),
+        Meeting.start_time <= end_utc,
+        Meeting.end_time >= start_utc,
+        meeting_attendees.c.meeting_start_time <= end_utc
     ]
     if exclude_meeting_id is not None:
         conditions.append(Meeting.id != exclude_meeting_id)
     
     stmt = (
         select(Meeting)
-        .join(Meeting.attendees)
+        .join(meeting_attendees, attendee_join)
         .where(and_(*conditions))
         .limit(1)
     )
     
+    with tracer.start_as_current_span("meeting.conflict_check") as span:
+        span.set_attribute("scheduler.attendee_count", len(user_ids))
+        result = await db.execute(stmt)
+        conflict = result.scalar_one_or_none() is not None
+        span.set_attribute("scheduler.conflict", conflict)
+    CONFLICT_CHECKS.labels("conflict" if conflict else "clear").inc()
+    return conflict
+
+async def get_busy_intervals(db, user_ids: list[int], start: datetime, end: datetime) -> dict[int, list[tuple[datetime, datetime]]]:
+    """
+    Load every meeting interval touching or overlapping [start, end] for the given users in one query.
+    """
+    stmt = (
+        select(meeting_attendees.c.user_id, Meeting.start_time, Meeting.end_time)
+        .join(meeting_attendees, attendee_join)
+        .where(
+            and_(
+                meeting_attendees.c.user_id.in_(user_ids),
+                Meeting.start_time <= ensure_utc(end),
+                Meeting.end_time >= ensure_utc(start),
+                meeting_attendees.c.meeting_start_time <= ensure_utc(end)
+            )
+        )
+    )
+    result = await db.execute(stmt)
+    busy = {}
+    for user_id, busy_start, busy_end in result.all():
+        busy.setdefault(user_id, []).append((busy_start, busy_end))
+    return busy
+
+
+async def get_conflict_report(
+    db,
+    start: datetime,
+    end: datetime,
+    user_ids: list[int],
+    exclude_meeting_id: int = None,
+    alternatives: int = 3
+) -> ConflictReport:
+    """
+    Describe every conflicting (attendee, meeting) pair for the given slot and
+    suggest the nearest conflict-free start times for the same attendees.
+
+    A single query loads the attendees' meetings within ALTERNATIVE_HORIZON of
+    the slot; conflicts and alternatives are both derived from that result.
+    Overlap uses the same closed-interval rule as has_time_conflict so a
+    suggested start is never rejected on retry.
+    """
+    start_utc = ensure_utc(start)
+    end_utc = ensure_utc(end)
+
+    conditions = [
+        meeting_attendees.c.user_id.in_(user_ids),
+        Meeting.start_time <= end_utc + ALTERNATIVE_HORIZON,
+        Meeting.end_time >= start_utc - ALTERNATIVE_HORIZON,
+        meeting_attendees.c.meeting_start_time <= end_utc + ALTERNATIVE_HORIZON
+    ]
+    if exclude_meeting_id is not None:
+        conditions.append(Meeting.id != exclude_meeting_id)
+
+    stmt = (
+        select(
+            meeting_attendees.c.user_id,
+            User.email,
+            Meeting.id,
+            Meeting.title,
+            Meeting.start_time,
+            Meeting.end_time
+        )
+        .join(meeting_attendees, attendee_join)
+        .join(User, User.id == meeting_attendees.c.user_id)
+        .where(and_(*conditions))
+        .order_by(Meeting.start_time, meeting_attendees.c.user_id)
+    )
     result = await db.execute(stmt)
-    return result.scalar_one_or_none() is not None
\ No newline at end of file
+    rows = result.all()
+
+    conflicts = [
+        {
+            "user_id": user_id,
+            "email": email,
+            "meeting_id": meeting_id,
+            "title": title,
+            "start_time": busy_start,
+            "end_time": busy_end
+        }
+        for user_id, email, meeting_id, title, busy_start, busy_end in rows
+        if busy_start <= end_utc and busy_end >= start_utc
+    ]
+    busy = _merge_closed([(row.start_time, row.end_time) for row in rows])
+    return ConflictReport(
+        conflicts=conflicts,
+        alternatives=_nearest_free_starts(busy, start_utc, end_utc - start_utc, alternatives)
+    )
+
+
+def _merge_closed(intervals):
+    """Merge closed intervals, joining ones that merely touch."""
+    merged = []
+    for busy_start, busy_end in sorted(intervals):
+        if merged and busy_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], busy_end))
+        else:
+            merged.append((busy_start, busy_end))
+    return merged
+
+
+def _nearest_free_starts(busy, start: datetime, duration: timedelta, limit: int) -> list[datetime]:
+    """Walk outward from ``start`` in ALTERNATIVE_STEP increments collecting free, future slots."""
+    starts = [s for s, _ in busy]
+    now = datetime.now(timezone.utc)
+
+    def is_free(candidate):
+        i = bisect_right(starts, candidate + duration)
+        return i == 0 or busy[i - 1][1] < candidate
+
+    found = []
+    steps = int(ALTERNATIVE_HORIZON / ALTERNATIVE_STEP)
+    for k in range(1, steps + 1):
+        for candidate in (start + k * ALTERNATIVE_STEP, start - k * ALTERNATIVE_STEP):
+            if len(found) < limit and candidate >= now and is_free(candidate):
+                found.append(candidate)
+        if len(found) >= limit:
+            break
+    return found
@@ -4,4 +4,9 @@ logger = logging.getLogger(__name__)
 
 async def send_reminder(meeting):
     # Placeholder: Implement actual notification logic here
-    logger.info(f"Reminder sent for meeting: {meeting.id if hasattr(meeting, 'id') else meeting}") 
\ No newline at end of file
+    logger.info(f"Reminder sent for meeting: {meeting.id if hasattr(meeting, 'id') else meeting}")
+
+async def notify_meetings_cancelled(cancelled_by_user: dict):
+    # Placeholder: one notice per affected user covering all of their cancelled meetings
+    for user_id, meetings in cancelled_by_user.items():
+        logger.info(f"Cancellation notice for user {user_id}: {[m['id'] for m in meetings]}")
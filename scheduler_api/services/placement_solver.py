@@ -0,0 +1,173 @@
+"""
+Placement solver for batch scheduling.
+
+Works purely on ints (epoch seconds and user ids) so it can run in a worker
+process without touching the database or the ORM.
+"""
+import asyncio
+import os
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+SOLVER_WORKERS = int(os.getenv("SOLVER_WORKERS", "2"))
+
+_executor = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=SOLVER_WORKERS)
+    return _executor
+
+
+class _Timeline:
+    """Sorted, non-overlapping intervals for a single user."""
+    __slots__ = ("starts", "items")
+
+    def __init__(self):
+        self.starts = []
+        self.items = []
+
+    @classmethod
+    def from_busy(cls, intervals):
+        """Build a timeline from raw busy intervals, merging any overlaps."""
+        timeline = cls()
+        for start, end in sorted(intervals):
+            if timeline.items and start <= timeline.items[-1][1]:
+                last_start, last_end, _ = timeline.items[-1]
+                timeline.items[-1] = (last_start, max(last_end, end), None)
+            else:
+                timeline.starts.append(start)
+                timeline.items.append((start, end, None))
+        return timeline
+
+    def add(self, start, end, owner):
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.items.insert(i, (start, end, owner))
+
+    def remove(self, start, owner):
+        i = bisect_right(self.starts, start) - 1
+        while self.items[i][2] != owner:
+            i -= 1
+        del self.starts[i]
+        del self.items[i]
+
+    def overlapping(self, start, end):
+        """
+        Owners of every interval overlapping or touching [start, end]; closed
+        intervals, like has_time_conflict, so placements pass its re-check.
+        """
+        i = max(bisect_right(self.starts, start) - 1, 0)
+        owners = []
+        while i < len(self.items) and self.items[i][0] <= end:
+            if self.items[i][1] >= start:
+                owners.append(self.items[i][2])
+            i += 1
+        return owners
+
+
+def _candidate_starts(request, static, step, deadline):
+    duration = request["duration"]
+    starts = set()
+    for window_start, window_end in request["windows"]:
+        start = -(-window_start // step) * step  # first slot boundary in the window
+        while start + duration <= window_end:
+            end = start + duration
+            if not any(static[u].overlapping(start, end) for u in request["check_ids"] if u in static):
+                starts.add(start)
+            start += step
+        if time.monotonic() > deadline:
+            break
+    return sorted(starts)
+
+
+def solve_placements(requests: list[dict], busy: dict, step: int, time_budget: float) -> dict:
+    """
+    Place as many requests as possible without overlaps.
+
+    Each request is a dict with ``duration``, ``windows`` (list of
+    ``(start, end)``) and ``check_ids`` (the attendees and organizer: users
+    whose existing calendar must be free and whom the placement occupies).
+    ``busy`` maps user id to existing ``(start, end)`` intervals.
+
+    A most-constrained-first greedy pass is followed by a local search that
+    places leftovers by relocating a single blocking meeting, until nothing
+    improves or the time budget runs out.
+    """
+    deadline = time.monotonic() + time_budget
+    static = {uid: _Timeline.from_busy(intervals) for uid, intervals in busy.items()}
+    candidates = [_candidate_starts(r, static, step, deadline) for r in requests]
+
+    timelines = defaultdict(_Timeline)
+    placed = {}
+
+    def place(i, start):
+        placed[i] = start
+        for uid in requests[i]["check_ids"]:
+            timelines[uid].add(start, start + requests[i]["duration"], i)
+
+    def unplace(i):
+        start = placed.pop(i)
+        for uid in requests[i]["check_ids"]:
+            timelines[uid].remove(start, i)
+
+    def blockers(i, start):
+        end = start + requests[i]["duration"]
+        found = set()
+        for uid in requests[i]["check_ids"]:
+            found.update(timelines[uid].overlapping(start, end))
+        found.discard(i)
+        return found
+
+    order = sorted(
+        range(len(requests)),
+        key=lambda i: (len(candidates[i]), -len(requests[i]["check_ids"]), -requests[i]["duration"]),
+    )
+    unplaced = []
+    for i in order:
+        for start in candidates[i]:
+            if not blockers(i, start):
+                place(i, start)
+                break
+        else:
+            unplaced.append(i)
+
+    improved = True
+    while improved and unplaced and time.monotonic() < deadline:
+        improved = False
+        for i in list(unplaced):
+            for start in candidates[i]:
+                if time.monotonic() >= deadline:
+                    break
+                blocking = blockers(i, start)
+                if len(blocking) != 1:
+                    continue
+                (j,) = blocking
+                previous = placed[j]
+                unplace(j)
+                place(i, start)
+                for alternative in candidates[j]:
+                    if alternative != previous and not blockers(j, alternative):
+                        place(j, alternative)
+                        break
+                else:
+                    unplace(i)
+                    place(j, previous)
+                    continue
+                unplaced.remove(i)
+                improved = True
+                break
+
+    return {"placements": placed, "unplaced": sorted(unplaced)}
+
+
+async def solve(requests: list[dict], busy: dict, step: int, time_budget: float) -> dict:
+    """Run :func:`solve_placements` in the solver process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), solve_placements, requests, busy, step, time_budget
+    )
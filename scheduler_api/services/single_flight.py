@@ -0,0 +1,114 @@
+import os
+import asyncio
+import logging
+from datetime import datetime
+from crud.meeting import get_user_meetings_in_range
+from services.conflict_checker import has_time_conflict
+from utils.time_utils import ensure_utc
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
+
+class _LeaderCancelled(Exception):
+    """The caller running a shared call went away before it finished."""
+
+
+class SingleFlight:
+    """
+    Lets concurrent callers asking for the same key share one in-flight call.
+
+    The first caller (the leader) runs the call itself, on its own database
+    session, so coalescing never takes an extra pool connection. Waiting
+    callers get the same result or exception. If the leader is cancelled,
+    for example because its client disconnected, the waiters start over and
+    one of them leads. Nothing is cached once the call completes.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.executed = 0
+        self.coalesced = 0
+        self._inflight = {}
+
+    async def do(self, key, fn):
+        while (future := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                self.coalesced -= 1
+
+        self.executed += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._settle(future, _LeaderCancelled())
+            raise
+        except Exception as e:
+            self._settle(future, e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    @staticmethod
+    def _settle(future: asyncio.Future, exception: Exception):
+        future.set_exception(exception)
+        # Mark the exception retrieved even if nobody was waiting
+        future.exception()
+
+    def stats(self) -> dict:
+        total = self.executed + self.coalesced
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalescing_ratio": round(self.coalesced / total, 4) if total else 0.0,
+            "in_flight": len(self._inflight)
+        }
+
+
+meetings_in_range_flight = SingleFlight("meetings_in_range")
+time_conflict_flight = SingleFlight("time_conflict")
+
+
+def single_flight_stats() -> dict:
+    return {flight.name: flight.stats() for flight in (meetings_in_range_flight, time_conflict_flight)}
+
+
+async def shared_user_meetings_in_range(db, user_id: int, start: datetime, end: datetime):
+    """
+    get_user_meetings_in_range, shared between concurrent identical requests.
+    The query runs on the leading caller's ``db``; the key includes its engine
+    (primary or replica) and organization.
+    """
+    start_utc, end_utc = ensure_utc(start), ensure_utc(end)
+    if not SINGLE_FLIGHT_ENABLED:
+        return await get_user_meetings_in_range(db, user_id, start_utc, end_utc)
+
+    key = (db.bind, db.info.get("organization_id"), user_id, start_utc, end_utc)
+    return await meetings_in_range_flight.do(key, lambda: get_user_meetings_in_range(db, user_id, start_utc, end_utc))
+
+
+async def shared_time_conflict(db, start: datetime, end: datetime, user_ids: list[int], exclude_meeting_id: int = None) -> bool:
+    """
+    has_time_conflict for read-only availability checks, shared between
+    concurrent identical requests. Booking paths must keep calling
+    has_time_conflict inside their locked transaction.
+    """
+    start_utc, end_utc = ensure_utc(start), ensure_utc(end)
+    if not SINGLE_FLIGHT_ENABLED:
+        return await has_time_conflict(db, start_utc, end_utc, user_ids, exclude_meeting_id)
+
+    key = (db.bind, db.info.get("organization_id"), start_utc, end_utc, tuple(sorted(set(user_ids))), exclude_meeting_id)
+    return await time_conflict_flight.do(key, lambda: has_time_conflict(db, start_utc, end_utc, user_ids, exclude_meeting_id))
@@ -0,0 +1,43 @@
+import os
+import logging
+from crud.user import search_users_by_prefix, search_users_by_substring
+from schemas.user import UserSummary
+from utils.cache import TTLCache
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+USER_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("USER_SEARCH_CACHE_TTL_SECONDS", "30"))
+USER_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("USER_SEARCH_CACHE_MAX_ENTRIES", "4096"))
+# pg_trgm cannot use its index for patterns shorter than one trigram
+MIN_SUBSTRING_QUERY_LENGTH = 3
+
+_search_cache = TTLCache(USER_SEARCH_CACHE_TTL_SECONDS, USER_SEARCH_CACHE_MAX_ENTRIES)
+
+
+async def search_users(db, q: str, limit: int) -> list[UserSummary]:
+    """
+    Typeahead lookup over active users' emails and names.
+
+    Prefix matches come first; queries of three or more characters are then
+    topped up with substring matches ranked by trigram similarity. Results are
+    cached briefly per (organization, query, limit), since keystrokes from many users repeat
+    the same short prefixes.
+    """
+    q = " ".join(q.split()).lower()
+    if not q:
+        return []
+    key = (db.info.get("organization_id"), q, limit)
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return cached
+
+    users = list(await search_users_by_prefix(db, q, limit))
+    if len(users) < limit and len(q) >= MIN_SUBSTRING_QUERY_LENGTH:
+        users += await search_users_by_substring(db, q, limit - len(users), [u.id for u in users])
+    results = [UserSummary.model_validate(u) for u in users]
+    _search_cache.set(key, results)
+    return results
@@ -0,0 +1,220 @@
+import os
+import csv
+import json
+import codecs
+import logging
+from collections import deque
+from pydantic import ValidationError
+from core.security import hash_passwords_parallel
+from crud.user import get_existing_emails, insert_users_ignoring_existing
+from schemas.user import UserImportRow
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+USER_IMPORT_BATCH_SIZE = int(os.getenv("USER_IMPORT_BATCH_SIZE", "1000"))
+# Emails of users allowed to import into their own organization
+USER_IMPORT_ADMINS = {
+    email.strip().lower() for email in os.getenv("USER_IMPORT_ADMINS", "").split(",") if email.strip()
+}
+
+CSV_COLUMNS = ("email", "full_name", "password")
+
+
+def can_import_users(user) -> bool:
+    """Whether the user is allowed to bulk-create accounts in their organization."""
+    return user.email.lower() in USER_IMPORT_ADMINS
+
+
+async def iter_text(chunks):
+    """Decode a stream of UTF-8 byte chunks, dropping a leading byte order mark."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+async def iter_lines(chunks):
+    """Yield decoded, non-blank lines from a stream of byte chunks."""
+    buffer = ""
+    async for text in iter_text(chunks):
+        buffer += text
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            if line.strip():
+                yield line.rstrip("\r")
+    if buffer.strip():
+        yield buffer.rstrip("\r")
+
+
+class _LineFeed:
+    """Lines queued for a csv.reader; it is only advanced once a whole record is queued."""
+
+    def __init__(self):
+        self.lines = deque()
+        self.size = 0
+
+    def append(self, line: str):
+        self.lines.append(line)
+        self.size += len(line)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.lines:
+            raise StopIteration
+        line = self.lines.popleft()
+        self.size -= len(line)
+        return line
+
+
+async def iter_csv_records(chunks):
+    """
+    Yield CSV records from a stream of byte chunks, skipping blank lines.
+
+    Lines are queued for a single csv.reader and the reader is advanced once
+    they close every quoted field, so quoted values may span lines. A record
+    left unterminated (or longer than the csv field size limit) is yielded as
+    an error string and ends the stream.
+    """
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    quotes = 0
+    buffer = ""
+    async for text in iter_text(chunks):
+        buffer += text
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            if not feed.lines and not line.strip():
+                continue
+            feed.append(line + "\n")
+            quotes += line.count('"')
+            if quotes % 2 == 0:
+                quotes = 0
+                yield next(reader)
+            elif feed.size > csv.field_size_limit():
+                yield "Unterminated quoted field"
+                return
+    if buffer.strip() or feed.lines:
+        feed.append(buffer)
+        quotes += buffer.count('"')
+        yield next(reader) if quotes % 2 == 0 else "Unterminated quoted field"
+
+
+async def parse_csv(records):
+    """
+    Yield (row number, fields or error) from CSV records with a header row
+    naming email, full_name and optionally password.
+    """
+    header = None
+    row_number = 0
+    async for values in records:
+        if header is None:
+            if isinstance(values, str):
+                raise ValueError(f"CSV header: {values}")
+            header = [name.strip().lower() for name in values]
+            missing = {"email", "full_name"} - set(header)
+            if missing:
+                raise ValueError(f"CSV header is missing: {', '.join(sorted(missing))}")
+            continue
+        row_number += 1
+        if isinstance(values, str):
+            yield row_number, values
+            continue
+        if len(values) != len(header):
+            yield row_number, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield row_number, {k: v for k, v in zip(header, values) if k in CSV_COLUMNS}
+
+
+async def parse_ndjson(lines):
+    """Yield (row number, fields or error) from newline-delimited JSON objects."""
+    row_number = 0
+    async for line in lines:
+        row_number += 1
+        try:
+            fields = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(fields, dict):
+            yield row_number, "Expected a JSON object"
+            continue
+        yield row_number, fields
+
+
+async def import_users(db, rows) -> list[dict]:
+    """
+    Create users from parsed (row number, fields or error) pairs in batches.
+
+    Each batch is validated and deduplicated in memory, checked against
+    existing emails with one query, hashed in the process pool and inserted
+    with one INSERT ... ON CONFLICT DO NOTHING, then committed. Returns one
+    result per row.
+    """
+    results = []
+    seen = set()
+    batch = []
+
+    async def flush():
+        results.extend(await _import_batch(db, batch, seen))
+        batch.clear()
+
+    async for row_number, fields in rows:
+        batch.append((row_number, fields))
+        if len(batch) >= USER_IMPORT_BATCH_SIZE:
+            await flush()
+    if batch:
+        await flush()
+    return results
+
+
+async def _import_batch(db, batch, seen: set) -> list[dict]:
+    outcomes = {}
+    candidates = []
+    for row_number, fields in batch:
+        if isinstance(fields, str):
+            outcomes[row_number] = {"row": row_number, "status": "invalid", "error": fields}
+            continue
+        try:
+            user = UserImportRow(**{k: v for k, v in fields.items() if v not in (None, "")})
+        except ValidationError as e:
+            error = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+            outcomes[row_number] = {"row": row_number, "email": fields.get("email"), "status": "invalid", "error": error}
+            continue
+        if user.email in seen:
+            outcomes[row_number] = {"row": row_number, "email": user.email, "status": "duplicate"}
+            continue
+        seen.add(user.email)
+        candidates.append((row_number, user))
+
+    existing = await get_existing_emails(db, [user.email for _, user in candidates]) if candidates else set()
+    new = [(row_number, user) for row_number, user in candidates if user.email not in existing]
+    hashes = await hash_passwords_parallel([user.password for _, user in new])
+    inserted = await insert_users_ignoring_existing(db, [
+        {
+            "email": user.email,
+            "full_name": user.full_name,
+            "hashed_password": hashed,
+            "is_active": True,
+            "timezone": "UTC"
+        }
+        for (_, user), hashed in zip(new, hashes)
+    ])
+    await db.commit()
+
+    for row_number, user in candidates:
+        if user.email in inserted:
+            outcomes[row_number] = {"row": row_number, "email": user.email, "status": "created", "user_id": inserted[user.email]}
+        else:
+            # Already present, or registered concurrently after the existence check
+            outcomes[row_number] = {"row": row_number, "email": user.email, "status": "exists"}
+    return [outcomes[row_number] for row_number, _ in batch]
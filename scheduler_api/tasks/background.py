@@ -1,27 +1,90 @@
 from fastapi import BackgroundTasks
-from sqlalchemy import delete, select
-from datetime import datetime, timedelta
-from dependencies import get_db
-from models import Meeting
+from sqlalchemy import and_, delete, func, select, text, update
+from sqlalchemy.orm import selectinload
+from datetime import datetime, timedelta, timezone
+from core.database import each_shard
+from models import Meeting, MeetingChange, MeetingChangeLogState
 from services.notification_service import send_reminder
+from core.metrics import timed_job
+import os
 import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Monthly meeting partitions are kept this far ahead of the current date
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "12"))
+# Delta-sync clients older than this must fall back to a full sync
+CHANGE_LOG_RETENTION_DAYS = int(os.getenv("CHANGE_LOG_RETENTION_DAYS", "30"))
+
+@timed_job("ensure_meeting_partitions")
+async def ensure_meeting_partitions():
+    async for db in each_shard():
+        try:
+            result = await db.execute(
+                text(
+                    "SELECT create_meeting_partitions(CURRENT_DATE, "
+                    "(CURRENT_DATE + make_interval(months => :months))::date)"
+                ),
+                {"months": PARTITION_MONTHS_AHEAD}
+            )
+            created = result.scalar_one()
+            await db.commit()
+            if created:
+                logger.info(f"Created {created} monthly meeting partitions")
+        except Exception as e:
+            logger.error(f"Error creating meeting partitions: {e}")
+            await db.rollback()
+
+@timed_job("purge_old_meetings")
 async def purge_old_meetings():
-    async for db in get_db():
+    async for db in each_shard():
         try:
-            cutoff = datetime.utcnow() - timedelta(days=30)
-            await db.execute(delete(Meeting).where(Meeting.end_time < cutoff))
+            cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+            # Whole expired months go as DETACH/DROP PARTITION ...
+            result = await db.execute(
+                text("SELECT drop_meeting_partitions_before(:cutoff)"), {"cutoff": cutoff}
+            )
+            dropped = result.scalar_one()
+            # ... and only the partially expired month needs a row-level DELETE.
+            # The start_time bound limits it to partitions that can hold expired rows.
+            await db.execute(
+                delete(Meeting).where(Meeting.start_time < cutoff, Meeting.end_time < cutoff)
+            )
             await db.commit()
-            logger.info(f"Purged meetings older than {cutoff}")
+            logger.info(f"Purged meetings older than {cutoff} ({dropped} partitions dropped)")
         except Exception as e:
             logger.error(f"Error purging meetings: {e}")
             await db.rollback()
 
+@timed_job("purge_change_log")
+async def purge_change_log():
+    async for db in each_shard():
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=CHANGE_LOG_RETENTION_DAYS)
+            # Clients whose version is below the highest purged one get 410 and resync
+            purged = (
+                delete(MeetingChange)
+                .where(MeetingChange.changed_at < cutoff)
+                .returning(MeetingChange.version)
+                .cte("purged")
+            )
+            await db.execute(
+                update(MeetingChangeLogState)
+                .values(purged_through=func.greatest(
+                    MeetingChangeLogState.purged_through,
+                    select(func.max(purged.c.version)).scalar_subquery()
+                ))
+            )
+            await db.commit()
+            logger.info(f"Purged meeting change log entries older than {cutoff}")
+        except Exception as e:
+            logger.error(f"Error purging change log: {e}")
+            await db.rollback()
+
+@timed_job("send_reminders")
 async def send_reminders():
-    async for db in get_db():
+    async for db in each_shard():
         try:
             now = datetime.utcnow()
             reminder_window = now + timedelta(minutes=30)
@@ -0,0 +1,253 @@
+import os
+import json
+import time
+import threading
+from collections import OrderedDict, deque
+import jwt
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+
+# Config
+API_URL = os.getenv("API_URL", "http://localhost:8000")
+API_TIMEOUT_SECONDS = float(os.getenv("API_TIMEOUT_SECONDS", "10"))
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "10"))
+MEETINGS_CACHE_TTL_SECONDS = int(os.getenv("MEETINGS_CACHE_TTL_SECONDS", "60"))
+MEETINGS_CACHE_MAX_ENTRIES = int(os.getenv("MEETINGS_CACHE_MAX_ENTRIES", "256"))
+USER_SEARCH_CACHE_TTL_SECONDS = int(os.getenv("USER_SEARCH_CACHE_TTL_SECONDS", "30"))
+CHANGE_FEED_BUFFER_SIZE = int(os.getenv("CHANGE_FEED_BUFFER_SIZE", "500"))
+# Longer than the API's STREAM_HEARTBEAT_SECONDS, so a silent stream means a dead connection
+CHANGE_FEED_READ_TIMEOUT_SECONDS = float(os.getenv("CHANGE_FEED_READ_TIMEOUT_SECONDS", "45"))
+CHANGE_FEED_IDLE_SECONDS = float(os.getenv("CHANGE_FEED_IDLE_SECONDS", "300"))
+CHANGE_FEED_MAX_FEEDS = int(os.getenv("CHANGE_FEED_MAX_FEEDS", "200"))
+
+
+@st.cache_resource
+def get_http_session():
+    """Keep-alive connection pool shared by every browser session on this server"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=API_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def api_request(method, path, token=None, **kwargs):
+    """Send a request to the backend over the pooled session"""
+    headers = kwargs.pop("headers", {})
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return get_http_session().request(
+        method,
+        f"{API_URL}{path}",
+        headers=headers,
+        timeout=API_TIMEOUT_SECONDS,
+        **kwargs
+    )
+
+def login(email, password, organization=None):
+    """Exchange credentials for a JWT; returns None when they are rejected"""
+    data = {"username": email, "password": password}
+    if organization:
+        data["organization"] = organization
+    response = api_request(
+        "POST",
+        "/auth/login",
+        data=data,
+        headers={"Content-Type": "application/x-www-form-urlencoded"}
+    )
+    if response.status_code == 200:
+        return response.json().get("access_token")
+    return None
+
+@st.cache_data(ttl=MEETINGS_CACHE_TTL_SECONDS, max_entries=MEETINGS_CACHE_MAX_ENTRIES, show_spinner=False)
+def fetch_meetings(token, start, end):
+    """
+    Meetings for the token's user between two ISO timestamps.
+
+    Results are cached per (token, start, end), so reruns triggered by widget
+    interactions reuse them instead of calling the API again. Errors raise
+    and are therefore never cached.
+    """
+    response = api_request("GET", "/meetings/", token, params={"start": start, "end": end})
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=MEETINGS_CACHE_TTL_SECONDS, max_entries=MEETINGS_CACHE_MAX_ENTRIES, show_spinner=False)
+def fetch_meeting_summary(token, start, end):
+    """Per-day counts and id/title/time stubs for a range, cached like fetch_meetings"""
+    response = api_request("GET", "/meetings/summary", token, params={"start": start, "end": end})
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=MEETINGS_CACHE_TTL_SECONDS, max_entries=MEETINGS_CACHE_MAX_ENTRIES, show_spinner=False)
+def fetch_meeting(token, meeting_id):
+    """Full details of one meeting, loaded when the user opens it"""
+    response = api_request("GET", f"/meetings/{meeting_id}", token)
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=USER_SEARCH_CACHE_TTL_SECONDS, max_entries=1024, show_spinner=False)
+def search_users(token, query, limit=10):
+    """Directory typeahead matches for a name or email fragment"""
+    response = api_request("GET", "/users/search", token, params={"q": query, "limit": limit})
+    response.raise_for_status()
+    return response.json()
+
+def invalidate_meetings():
+    """Drop cached meeting data; a change can appear on several users' calendars"""
+    fetch_meetings.clear()
+    fetch_meeting_summary.clear()
+    fetch_meeting.clear()
+
+def create_meeting(token, meeting_data):
+    response = api_request("POST", "/meetings/", token, json=meeting_data)
+    if response.status_code == 201:
+        invalidate_meetings()
+    return response
+
+def update_meeting(token, meeting_id, meeting_data):
+    response = api_request("PUT", f"/meetings/{meeting_id}", token, json=meeting_data)
+    if response.status_code == 200:
+        invalidate_meetings()
+    return response
+
+def delete_meeting(token, meeting_id):
+    response = api_request("DELETE", f"/meetings/{meeting_id}", token)
+    if response.status_code == 204:
+        invalidate_meetings()
+    return response
+
+
+class MeetingChangeFeed:
+    """
+    Follows /meetings/stream for one token on a background thread and keeps
+    the latest deltas. Each browser session reads them from its own cursor,
+    so several tabs of the same user all see every event. The thread ends
+    when the feed is stopped, goes unread for CHANGE_FEED_IDLE_SECONDS, or
+    the API rejects the token.
+    """
+
+    def __init__(self, token):
+        self.token = token
+        self._expires_at = _token_expiry(token)
+        self._events = deque(maxlen=CHANGE_FEED_BUFFER_SIZE)
+        self._next = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._last_read = time.monotonic()
+        # Set when the token is refused or expired; such a feed is kept so it is not retried
+        self.rejected = False
+        threading.Thread(target=self._run, name="meeting-change-feed", daemon=True).start()
+
+    @property
+    def running(self):
+        return not self._stopped.is_set()
+
+    @property
+    def cursor(self):
+        """Position after the newest event; take it before loading the calendar"""
+        with self._lock:
+            self._last_read = time.monotonic()
+            return self._next
+
+    def events_since(self, cursor):
+        """Events after ``cursor`` and the new cursor; a lone resync if some were already dropped"""
+        with self._lock:
+            self._last_read = time.monotonic()
+            oldest = self._next - len(self._events)
+            if cursor < oldest:
+                return [{"op": "resync"}], self._next
+            return list(self._events)[cursor - oldest:], self._next
+
+    def stop(self):
+        self._stopped.set()
+
+    def _publish(self, event):
+        with self._lock:
+            self._events.append(event)
+            self._next += 1
+
+    def _should_stop(self):
+        if time.monotonic() - self._last_read > CHANGE_FEED_IDLE_SECONDS:
+            self.stop()
+        return self._stopped.is_set()
+
+    def _run(self):
+        delay = 1
+        while not self._should_stop():
+            try:
+                # Not on the pooled session: the stream holds its connection open
+                with requests.get(
+                    f"{API_URL}/meetings/stream",
+                    headers={"Authorization": f"Bearer {self.token}", "Accept": "text/event-stream"},
+                    stream=True,
+                    timeout=(API_TIMEOUT_SECONDS, CHANGE_FEED_READ_TIMEOUT_SECONDS)
+                ) as response:
+                    if 400 <= response.status_code < 500:
+                        self.rejected = True  # Logging in again gives a new token and a new feed
+                        break
+                    response.raise_for_status()
+                    # Anything sent before this connection was missed
+                    self._publish({"op": "resync"})
+                    delay = 1
+                    # chunk_size=None hands over each event as it arrives instead of waiting for 512 bytes
+                    for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                        if self._should_stop():
+                            break
+                        if line and line.startswith("data:"):
+                            self._publish(json.loads(line[len("data:"):]))
+            except (requests.RequestException, ValueError):
+                pass
+            if self._expires_at is not None and time.time() >= self._expires_at:
+                # Server errors will not turn into events for an expired token
+                self.rejected = True
+                break
+            self._stopped.wait(delay)
+            delay = min(delay * 2, 30)
+        self.stop()
+
+
+def _token_expiry(token):
+    """``exp`` claim of a JWT (read without verifying it), or None"""
+    try:
+        return jwt.decode(token, options={"verify_signature": False}).get("exp")
+    except jwt.PyJWTError:
+        return None
+
+
+class ChangeFeeds:
+    """Running change feeds by token, least recently used first"""
+
+    def __init__(self):
+        self._feeds = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token):
+        with self._lock:
+            for stale in [t for t, feed in self._feeds.items() if not feed.running and not feed.rejected]:
+                del self._feeds[stale]
+            feed = self._feeds.get(token)
+            if feed is None:
+                feed = self._feeds[token] = MeetingChangeFeed(token)
+                while len(self._feeds) > CHANGE_FEED_MAX_FEEDS:
+                    self._feeds.popitem(last=False)[1].stop()
+            self._feeds.move_to_end(token)
+            return feed
+
+    def stop(self, token):
+        with self._lock:
+            feed = self._feeds.pop(token, None)
+        if feed is not None:
+            feed.stop()
+
+@st.cache_resource(show_spinner=False)
+def get_change_feeds():
+    """Change feed registry shared by every browser session on this server"""
+    return ChangeFeeds()
+
+def get_change_feed(token):
+    """Live change feed for a token; a new one replaces a feed that has stopped"""
+    return get_change_feeds().get(token)
+
+def stop_change_feed(token):
+    get_change_feeds().stop(token)
@@ -1,14 +1,14 @@
 import streamlit as st
-import requests
 import os
 import jwt
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from streamlit_calendar import calendar
 import time
+import api_client
 
 # Config
-API_URL = os.getenv("API_URL", "http://localhost:8000")
 JWT_SECRET = os.getenv("JWT_SECRET", "your_strong_secret_here")
+CHANGE_FEED_POLL_SECONDS = float(os.getenv("CHANGE_FEED_POLL_SECONDS", "2"))
 
 st.set_page_config(
         page_title="Meeting Scheduler", 
@@ -85,94 +85,163 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def get_auth_token(email, password):
+def get_auth_token(email, password, organization=None):
     """Authenticate user and return JWT token"""
     try:
-        response = requests.post(
-            f"{API_URL}/auth/login",
-            data={"username": email, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
-        if response.status_code == 200:
-            return response.json().get("access_token")
+        return api_client.login(email, password, organization)
     except Exception as e:
         st.error(f"Connection error: {str(e)}")
     return None
 
-def fetch_meetings(start_date=None, end_date=None):
-    """Fetch meetings from the backend API"""
+def fetch_meeting_stubs(start_date, end_date):
+    """Fetch id/title/time stubs for the calendar (cached per token and range)"""
     try:
-        headers = {
-            "Authorization": f"Bearer {st.session_state.token}",
-            "Content-Type": "application/json"
-        }
-        
-        params = {}
-        if start_date and end_date:
-            params = {
-                "start": start_date.isoformat() + "Z",
-                "end": end_date.isoformat() + "Z"
-            }
-        
-        response = requests.get(
-            f"{API_URL}/meetings/",
-            headers=headers,
-            params=params
+        summary = api_client.fetch_meeting_summary(
+            st.session_state.token,
+            start_date.isoformat() + "Z",
+            end_date.isoformat() + "Z"
         )
-        return response.json() if response.status_code == 200 else []
+        return summary["meetings"]
     except Exception as e:
         st.error(f"Error fetching meetings: {str(e)}")
         return []
 
+def load_calendar_stubs(start_date, end_date):
+    """Stubs for the visible range, kept current by apply_meeting_changes between reruns"""
+    live = st.session_state.get("live_stubs")
+    if live is None or live["range"] != (start_date, end_date):
+        # Take the cursor first so changes made during the fetch are replayed onto it
+        feed = api_client.get_change_feed(st.session_state.token)
+        cursor = feed.cursor
+        stubs = fetch_meeting_stubs(start_date, end_date)
+        live = {"range": (start_date, end_date), "feed": feed, "cursor": cursor, "stubs": {m["id"]: m for m in stubs}}
+        st.session_state.live_stubs = live
+    return list(live["stubs"].values())
+
+def apply_meeting_changes():
+    """Apply deltas from the live change feed to the calendar; returns whether it changed"""
+    live = st.session_state.get("live_stubs")
+    if live is None:
+        return False
+    feed = api_client.get_change_feed(st.session_state.token)
+    if feed is not live["feed"]:
+        # The feed stopped and was replaced; its cursor means nothing to the new one
+        st.session_state.pop("live_stubs")
+        return True
+    events, live["cursor"] = feed.events_since(live["cursor"])
+    if not events:
+        return False
+    # Cached lists and details for other ranges may include the changed meetings
+    api_client.invalidate_meetings()
+    start, end = live["range"]
+    for event in events:
+        if event["op"] == "resync":
+            st.session_state.pop("live_stubs")
+            return True
+        meeting = event["meeting"]
+        live["stubs"].pop(meeting["id"], None)
+        if event["op"] != "deleted" and start <= parse_calendar_date(meeting["start_time"]) < end:
+            live["stubs"][meeting["id"]] = meeting
+    return True
+
+@st.experimental_fragment(run_every=CHANGE_FEED_POLL_SECONDS)
+def watch_meeting_changes():
+    """Rerun the page when another user's change reaches this calendar"""
+    if apply_meeting_changes():
+        st.rerun()
+
+def fetch_meeting(meeting_id):
+    """Fetch full details of one meeting, or None if it is gone"""
+    try:
+        return api_client.fetch_meeting(st.session_state.token, meeting_id)
+    except Exception as e:
+        st.error(f"Error fetching meeting: {str(e)}")
+        return None
+
+def search_users(query):
+    """Directory matches for a typeahead query (cached per token and query)"""
+    try:
+        return api_client.search_users(st.session_state.token, query)
+    except Exception as e:
+        st.error(f"Error searching users: {str(e)}")
+        return []
+
+def attendee_picker(state_key, initial):
+    """Search box and attendee multiselect; the selection survives new search results"""
+    if state_key not in st.session_state:
+        st.session_state[state_key] = list(initial)
+    selected = st.session_state[state_key]
+    query = st.text_input("Find attendees", key=f"{state_key}_query", placeholder="Type a name or email")
+    found = [user["email"] for user in search_users(query.strip())] if query.strip() else []
+    options = list(dict.fromkeys(selected + [st.session_state.user_email] + found))
+    selected = st.multiselect("Attendees", options, default=selected, key=f"{state_key}_select")
+    st.session_state[state_key] = selected
+    return selected
+
 def create_meeting(meeting_data):
     """Create a new meeting"""
     try:
-        headers = {
-            "Authorization": f"Bearer {st.session_state.token}",
-            "Content-Type": "application/json"
-        }
-        response = requests.post(
-            f"{API_URL}/meetings/", 
-            json=meeting_data, 
-            headers=headers
-        )
-        return response
+        response = api_client.create_meeting(st.session_state.token, meeting_data)
     except Exception as e:
         st.error(f"Connection error: {str(e)}")
         return None
+    # Reload the calendar rather than wait for the change to come back over the feed
+    st.session_state.pop("live_stubs", None)
+    return response
 
 def update_meeting(meeting_id, meeting_data):
     """Update an existing meeting"""
     try:
-        headers = {
-            "Authorization": f"Bearer {st.session_state.token}",
-            "Content-Type": "application/json"
-        }
-        response = requests.put(
-            f"{API_URL}/meetings/{meeting_id}", 
-            json=meeting_data, 
-            headers=headers
-        )
-        return response
+        response = api_client.update_meeting(st.session_state.token, meeting_id, meeting_data)
     except Exception as e:
         st.error(f"Connection error: {str(e)}")
         return None
+    st.session_state.pop("live_stubs", None)
+    return response
 
 def delete_meeting(meeting_id):
     """Delete a meeting"""
     try:
-        headers = {
-            "Authorization": f"Bearer {st.session_state.token}",
-            "Content-Type": "application/json"
-        }
-        response = requests.delete(
-            f"{API_URL}/meetings/{meeting_id}", 
-            headers=headers
-        )
-        return response
+        response = api_client.delete_meeting(st.session_state.token, meeting_id)
     except Exception as e:
         st.error(f"Connection error: {str(e)}")
         return None
+    st.session_state.pop("live_stubs", None)
+    return response
+
+def default_visible_range(view, today):
+    """Dates the calendar shows for a view before it reports its own range"""
+    day = datetime(today.year, today.month, today.day)
+    if view == "timeGridDay":
+        return day, day + timedelta(days=1)
+    if view == "dayGridMonth":
+        # Month grids start on the Sunday on or before the 1st and span six weeks
+        first = day.replace(day=1)
+        grid_start = first - timedelta(days=(first.weekday() + 1) % 7)
+        return grid_start, grid_start + timedelta(weeks=6)
+    week_start = day - timedelta(days=(day.weekday() + 1) % 7)
+    return week_start, week_start + timedelta(weeks=1)
+
+def parse_calendar_date(value):
+    """Naive UTC datetime from a FullCalendar date string"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def describe_error(response):
+    """Turn an API error response into a readable message"""
+    if not response:
+        return "Unknown error"
+    detail = response.json().get("detail", "Unknown error")
+    if isinstance(detail, dict) and "conflicts" in detail:
+        lines = [detail.get("message", "Scheduling conflict detected")]
+        for conflict in detail["conflicts"]:
+            lines.append(f"- {conflict['email']}: {conflict['title']} ({conflict['start_time']} - {conflict['end_time']})")
+        if detail.get("alternatives"):
+            lines.append("Free alternative start times: " + ", ".join(detail["alternatives"]))
+        return "\n".join(lines)
+    return detail
 
 # --- Add helpers for session persistence ---
 def persist_session():
@@ -222,13 +291,14 @@ def show_login_page():
     with st.form("login_form", clear_on_submit=True):
         email = st.text_input("Email", key="login_email")
         password = st.text_input("Password", type="password", key="login_password")
+        organization = st.text_input("Organization (optional)", key="login_organization")
         submit_button = st.form_submit_button("Login")
         
         if submit_button:
             if not email or not password:
                 st.error("Please enter both email and password")
             else:
-                token = get_auth_token(email, password)
+                token = get_auth_token(email, password, organization.strip() or None)
                 if token:
                     st.session_state.token = token
                     st.session_state.logged_in = True
@@ -264,6 +334,8 @@ def show_main_dashboard():
         unsafe_allow_html=True
     )
     
+    watch_meeting_changes()
+    
     # Create two columns
     col1, col2 = st.columns([3, 2], gap="large")
     
@@ -280,8 +352,12 @@ def show_main_dashboard():
             index=view_options.index(st.session_state.calendar_view),
             key="calendar_view_select"
         )
+        if selected_view != st.session_state.calendar_view or "visible_range" not in st.session_state:
+            st.session_state.visible_range = default_visible_range(selected_view, datetime.utcnow())
         st.session_state.calendar_view = selected_view
         
+        visible_start, visible_end = st.session_state.visible_range
+        
         # Calendar configuration
         calendar_options = {
             "editable": "false",
@@ -292,14 +368,13 @@ def show_main_dashboard():
                 "right": ""
             },
             "initialView": st.session_state.calendar_view,
+            # Keep the calendar on the page the user navigated to across reruns
+            "initialDate": (visible_start + (visible_end - visible_start) / 2).isoformat(),
             "navLinks": "true",
         }
         
-        # Fetch meetings for the current month
-        today = datetime.utcnow()
-        first_day = today.replace(day=1)
-        last_day = (today.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
-        meetings = fetch_meetings(first_day, last_day)
+        # Fetch stubs for the range the calendar currently shows; details load on click
+        meetings = load_calendar_stubs(visible_start, visible_end)
         events = transform_meetings_to_events(meetings)
         
         # Display the calendar
@@ -318,10 +393,23 @@ def show_main_dashboard():
             key=f"calendar_{st.session_state.calendar_refresh}"
         )
         
+        # Refetch when the user pages to different dates
+        # (the component keeps returning its last event, so only act on new ones)
+        dates_set = calendar_result.get("datesSet")
+        if dates_set and dates_set != st.session_state.get("last_dates_set"):
+            st.session_state.last_dates_set = dates_set
+            reported = (parse_calendar_date(dates_set["start"]), parse_calendar_date(dates_set["end"]))
+            if reported != st.session_state.visible_range:
+                st.session_state.visible_range = reported
+                st.rerun()
+        
         # Show meeting details when an event is clicked
-        if calendar_result.get("eventClick"):
-            event = calendar_result["eventClick"]["event"]
-            st.session_state.selected_meeting = event
+        event_click = calendar_result.get("eventClick")
+        if event_click and event_click != st.session_state.get("last_event_click"):
+            st.session_state.last_event_click = event_click
+            meeting = fetch_meeting(event_click["event"]["id"])
+            if meeting:
+                st.session_state.selected_meeting = transform_meetings_to_events([meeting])[0]
         
         st.markdown('</div>', unsafe_allow_html=True)  # Close card
     
@@ -330,6 +418,9 @@ def show_main_dashboard():
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.subheader("Schedule New Meeting")
         
+        # Outside the form so each keystroke can query the directory
+        attendees = attendee_picker("new_meeting_attendees", [st.session_state.user_email])
+        
         with st.form("meeting_form", clear_on_submit=True):
             title = st.text_input("Title", max_chars=100)
             description = st.text_area("Description", max_chars=500, height=100)
@@ -347,15 +438,6 @@ def show_main_dashboard():
             start_datetime = datetime.combine(start_time, start_time_time)
             end_datetime = datetime.combine(end_time, end_time_time)
             
-            # Get available users (in a real app, fetch from backend)
-            available_users = [
-                "user1@example.com", 
-                "user2@example.com", 
-                "user3@example.com",
-                st.session_state.user_email
-            ]
-            attendees = st.multiselect("Attendees", available_users, default=[st.session_state.user_email])
-            
             if st.form_submit_button("Schedule Meeting"):
                 if not title:
                     st.error("Title is required")
@@ -373,14 +455,12 @@ def show_main_dashboard():
                     response = create_meeting(meeting_data)
                     if response and response.status_code == 201:
                         st.success("Meeting scheduled successfully!")
+                        st.session_state.pop("new_meeting_attendees", None)
                         persist_session()
                         time.sleep(1)
                         st.experimental_rerun()
                     else:
-                        error = "Unknown error"
-                        if response:
-                            error = response.json().get("detail", "Unknown error")
-                        st.error(f"Error scheduling meeting: {error}")
+                        st.error(f"Error scheduling meeting: {describe_error(response)}")
         
         st.markdown('</div>', unsafe_allow_html=True)  # Close card
     
@@ -408,6 +488,9 @@ def show_main_dashboard():
                 st.write(f"**Attendees:** {event['extendedProps']['attendees']}")
         
         with tab2:
+            current_attendees = event.get("extendedProps", {}).get("attendees", "").split(", ") if event.get("extendedProps", {}).get("attendees") else []
+            edit_attendees = attendee_picker(f"edit_attendees_{meeting_id}", current_attendees)
+            
             with st.form("edit_meeting_form"):
                 # Parse datetime strings
                 start_dt = datetime.fromisoformat(event['start'].replace('Z', '+00:00'))
@@ -426,18 +509,6 @@ def show_main_dashboard():
                     edit_end_date = st.date_input("End Date", value=end_dt.date())
                     edit_end_time = st.time_input("End Time", value=end_dt.time())
                 
-                # Get current attendees
-                current_attendees = event.get("extendedProps", {}).get("attendees", "").split(", ") if event.get("extendedProps", {}).get("attendees") else []
-                
-                # Get available users
-                available_users = [
-                    "user1@example.com", 
-                    "user2@example.com", 
-                    "user3@example.com",
-                    st.session_state.user_email
-                ]
-                edit_attendees = st.multiselect("Attendees", available_users, default=current_attendees)
-                
                 col_save, col_delete, col_cancel = st.columns(3)
                 
                 with col_save:
@@ -462,6 +533,7 @@ def show_main_dashboard():
                             if response and response.status_code == 200:
                                 st.success("Meeting updated successfully!")
                                 st.session_state.selected_meeting = None
+                                st.session_state.pop(f"edit_attendees_{meeting_id}", None)
                                 st.session_state.calendar_refresh += 1
                                 persist_session()
                                 time.sleep(1)
@@ -491,6 +563,9 @@ def show_main_dashboard():
                 with col_cancel:
                     if st.form_submit_button("Cancel"):
                         st.session_state.selected_meeting = None
+                        st.session_state.pop(f"edit_attendees_{meeting_id}", None)
+                        # Remount the calendar so clicking the same event opens it again
+                        st.session_state.calendar_refresh += 1
                         st.experimental_rerun()
         
         st.markdown('</div>', unsafe_allow_html=True)  # Close card
@@ -498,10 +573,12 @@ def show_main_dashboard():
     # Logout button
     st.sidebar.markdown(f"Logged in as: **{st.session_state.user_email}**")
     if st.sidebar.button("Logout"):
+        api_client.stop_change_feed(st.session_state.token)
         st.session_state.logged_in = False
         st.session_state.token = None
         st.session_state.user_email = None
         st.session_state.selected_meeting = None
+        st.session_state.pop("live_stubs", None)
         persist_session()
         st.success("Logged out successfully!")
         time.sleep(1)